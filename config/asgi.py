@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# Worker başlarken önbellekleri ve bağlantıları arka planda ısıt (/ready bunu bekler);
+# fork edilen worker'lar kendi ısınmasını başlatır
+from main import warmup  # noqa: E402
+
+warmup.install()
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv  # ✅ YENİ
 
@@ -44,7 +45,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'main.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Hash'li statik dosyaları uzun süreli önbellek başlıklarıyla, .br/.gz olarak sunar
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -78,8 +82,41 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    },
+    # ActivityLog, ChatMessage ve ContactMessage (main/routers.py)
+    'logs': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('LOGS_DB_PATH', BASE_DIR / 'logs.sqlite3'),
+    },
 }
+LOGS_DATABASE = 'logs'
+DATABASE_ROUTERS = ['main.routers.LogDatabaseRouter']
+
+# SQLite yüksek eşzamanlılık profili (SQLITE_PRODUCTION=True)
+SQLITE_PRODUCTION = os.environ.get('SQLITE_PRODUCTION', 'False') == 'True'
+SQLITE_PRAGMAS = {}
+SQLITE_WRITE_RETRIES = int(os.environ.get('SQLITE_WRITE_RETRIES', '5'))
+
+if SQLITE_PRODUCTION:
+    for _db in DATABASES.values():
+        # Kalıcı bağlantılar; bağlantı her istekte yeniden kurulmaz
+        _db['CONN_MAX_AGE'] = int(os.environ.get('SQLITE_CONN_MAX_AGE', '600'))
+        _db['CONN_HEALTH_CHECKS'] = True
+        _db['OPTIONS'] = {
+            # Yazma transaction'ları kilidi baştan alır (BEGIN IMMEDIATE)
+            'transaction_mode': 'IMMEDIATE',
+            # Kilit için saniye cinsinden bekleme süresi
+            'timeout': 20,
+        }
+    # connection_created sinyalinde uygulanır (main/db.py)
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', '20000')),
+        'synchronous': 'NORMAL',
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024))),
+        'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', '-64000')),
+        'temp_store': 'MEMORY',
+    }
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -100,6 +137,13 @@ AUTH_PASSWORD_VALIDATORS = [
 # Custom User Model
 AUTH_USER_MODEL = 'main.User'
 
+# Oturum kullanıcısı önbellekten yüklenir (main/backends.py)
+AUTHENTICATION_BACKENDS = ['main.backends.CachedModelBackend']
+USER_CACHE_TIMEOUT = int(os.environ.get('USER_CACHE_TIMEOUT', '900'))
+
+# Oturumlar önce önbellekten okunur, veritabanına da yazılır
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
 # Internationalization
 LANGUAGE_CODE = 'tr-tr'
 TIME_ZONE = 'Europe/Istanbul'
@@ -111,6 +155,32 @@ STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# collectstatic sırasında dosya adlarına içerik hash'i eklenir ve gzip/brotli
+# sıkıştırılmış kopyalar üretilir; hash'li dosyalar "immutable" olarak sunulur.
+# Manifest'li depolama yalnızca STATIC_MANIFEST=True iken ya da (DEBUG=False ve
+# ayar verilmemişse) collectstatic çalıştırılırken/manifest dosyası varken seçilir.
+# Böylece collectstatic çalıştırılmadan açılan kurulum 500 yerine hash'siz
+# dosyaları STATICFILES_DIRS'ten sunar.
+_static_manifest = os.environ.get('STATIC_MANIFEST', '')
+if _static_manifest:
+    STATIC_MANIFEST = _static_manifest == 'True'
+else:
+    STATIC_MANIFEST = not DEBUG and (
+        (STATIC_ROOT / 'staticfiles.json').exists() or sys.argv[1:2] == ['collectstatic']
+    )
+WHITENOISE_USE_FINDERS = not STATIC_MANIFEST
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'whitenoise.storage.CompressedManifestStaticFilesStorage' if STATIC_MANIFEST
+            else 'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -123,3 +193,75 @@ LOGOUT_REDIRECT_URL = 'home'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+
+# Prometheus metrikleri
+# Her worker kendi dosyasını METRICS_DIR'e yazar; dizin aynı sunucudaki tüm worker'larca yazılabilir olmalı.
+# Boş bırakılırsa yalnızca isteği karşılayan sürecin metrikleri döner.
+METRICS_DIR = os.environ.get('METRICS_DIR', str(BASE_DIR / 'metrics'))
+METRICS_FLUSH_INTERVAL = int(os.environ.get('METRICS_FLUSH_INTERVAL', '5'))
+# Boşsa /metrics herkese açıktır; üretimde ayarlayın (istekte Authorization: Bearer <token>)
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Tamponlu aktivite logu (main/activity.py)
+ACTIVITY_LOG_BUFFER_SIZE = int(os.environ.get('ACTIVITY_LOG_BUFFER_SIZE', '100'))
+ACTIVITY_LOG_FLUSH_INTERVAL = float(os.environ.get('ACTIVITY_LOG_FLUSH_INTERVAL', '2'))
+# True: her kayıt anında yazılır (testlerde kullanın)
+ACTIVITY_LOG_SYNC = os.environ.get('ACTIVITY_LOG_SYNC', 'False') == 'True'
+
+# ActivityLog saklama (python manage.py prune_activity_logs)
+ACTIVITY_LOG_RETENTION_DAYS = int(os.environ.get('ACTIVITY_LOG_RETENTION_DAYS', '90'))
+ACTIVITY_LOG_ARCHIVE_DIR = os.environ.get('ACTIVITY_LOG_ARCHIVE_DIR', BASE_DIR / 'archive')
+
+# Bu kadar saat içinde bitirilmeyen quiz denemeleri terk edilmiş sayılır
+# (python manage.py cleanup_attempts)
+ABANDONED_ATTEMPT_HOURS = int(os.environ.get('ABANDONED_ATTEMPT_HOURS', '24'))
+
+# Önbellek: dosya tabanlı önbellek aynı makinedeki tüm worker'lar arasında paylaşılır
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', str(BASE_DIR / 'cache')),
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+# Anonim kullanıcılar için tam sayfa önbelleği (ana sayfa, hakkımızda, iletişim)
+PAGE_CACHE_TIMEOUT = int(os.environ.get('PAGE_CACHE_TIMEOUT', '600'))
+
+# İstek sınırlama (main/throttle.py): kapsam -> [(tür, istek sınırı, pencere saniye)]
+THROTTLE_ENABLED = os.environ.get('THROTTLE_ENABLED', 'True') == 'True'
+# Kurallar: (tür, sınır, pencere saniyesi); türler için bkz. main/throttle.py
+THROTTLE_RULES = {
+    'login': [('ip', 30, 300), ('username_ip', 5, 300), ('username', 20, 900)],
+    'register': [('ip', 5, 3600)],
+    'contact': [('ip', 5, 3600), ('username', 3, 3600)],
+}
+# İlk engel süresi (saniye); her tekrar eden ihlalde ikiye katlanır
+THROTTLE_LOCKOUT_BASE = 60
+THROTTLE_LOCKOUT_MAX = 24 * 3600
+# Uygulama bir ters proxy arkasındaysa istemci IP'si X-Forwarded-For'dan alınır
+THROTTLE_TRUST_FORWARDED_FOR = os.environ.get('THROTTLE_TRUST_FORWARDED_FOR', 'False') == 'True'
+
+# Veritabanı tabanlı iş kuyruğu (main/jobs.py, python manage.py runworker)
+# True: işler kuyruğa yazılmadan hemen çalıştırılır (geliştirme ve testler)
+JOBS_INLINE = os.environ.get('JOBS_INLINE', str(DEBUG)) == 'True'
+JOB_MAX_ATTEMPTS = 5
+# Görünürlük süresi: bu sürede bitmeyen iş başka bir worker tarafından tekrar alınır
+JOB_VISIBILITY_TIMEOUT = 300
+# Yeniden deneme beklemesi: JOB_RETRY_BASE * 2^(deneme - 1), en fazla JOB_RETRY_MAX saniye
+JOB_RETRY_BASE = 10
+JOB_RETRY_MAX = 3600
+JOB_POLL_INTERVAL = float(os.environ.get('JOB_POLL_INTERVAL', '1'))
+
+# Async panolar (main/dashboards.py); ASGI (config/asgi.py) altında çalıştırılırken açın
+ASYNC_DASHBOARDS = os.environ.get('ASYNC_DASHBOARDS', 'False') == 'True'
+# Pano sorgularını aynı anda çalıştıran thread sayısı (her thread kendi bağlantısını tutar)
+DASHBOARD_QUERY_THREADS = int(os.environ.get('DASHBOARD_QUERY_THREADS', '8'))
+
+# Worker ısınması (main/warmup.py); bitene kadar /ready 503 döner
+WARMUP_ENABLED = os.environ.get('WARMUP_ENABLED', 'True') == 'True'
+# Uygulama worker'lar fork edilmeden önce ana süreçte yükleniyorsa (gunicorn --preload) True yapın:
+# ana süreç ısınmayı atlar, her worker fork sonrası kendi ısınmasını başlatır
+WARMUP_PRELOAD = os.environ.get('WARMUP_PRELOAD', 'False') == 'True'
@@ -0,0 +1,89 @@
+"""
+Hesap silme: kullanıcı silme talebinde hesap hemen pasifleşir ve oturumu
+kapanır; verileri arka planda (purge_deleted_accounts) küçük parçalar halinde
+silinir. Böylece yoğun kullanıcıların silinmesi SQLite yazma kilidini uzun
+süre tutmaz.
+"""
+import time
+
+from django.utils import timezone
+
+from .db import retry_on_locked
+from .models import (
+    User, ParentStudent, UserBadge, QuizAttempt, UserAnswer, UserCardRead, DailyCardLimit,
+    ActivityLog, ActivityRollup, ChatMessage, PointsEntry,
+)
+
+
+def request_deletion(user):
+    user.is_active = False
+    user.deletion_requested_at = timezone.now()
+    user.save(update_fields=['is_active', 'deletion_requested_at'])
+
+
+def pending_deletions():
+    return User.objects.filter(deletion_requested_at__isnull=False, is_active=False)
+
+
+def _child_querysets(user_id):
+    # Çocuk tablolar önce silinir (cevaplar denemelerden önce)
+    return [
+        UserAnswer.objects.filter(attempt__user_id=user_id),
+        QuizAttempt.objects.filter(user_id=user_id),
+        UserBadge.objects.filter(user_id=user_id),
+        UserCardRead.objects.filter(user_id=user_id),
+        DailyCardLimit.objects.filter(user_id=user_id),
+        PointsEntry.objects.filter(user_id=user_id),
+        ParentStudent.objects.filter(parent_id=user_id),
+        ParentStudent.objects.filter(student_id=user_id),
+        ActivityLog.objects.filter(user_id=user_id),
+        ActivityRollup.objects.filter(user_id=user_id),
+        ChatMessage.objects.filter(user_id=user_id),
+    ]
+
+
+def _delete_in_chunks(queryset, chunk_size, pause):
+    model = queryset.model
+    using = queryset.db
+    deleted = 0
+    while True:
+        ids = list(queryset.values_list('id', flat=True)[:chunk_size])
+        if not ids:
+            return deleted
+        # Her parça kendi kısa transaction'ında silinir
+        retry_on_locked(using=using)(
+            lambda: model.objects.filter(id__in=ids).delete()
+        )()
+        deleted += len(ids)
+        if pause:
+            time.sleep(pause)
+
+
+def purge_user(user, chunk_size=500, pause=0.05):
+    """Kullanıcının verilerini parça parça, en son kullanıcıyı siler; model adına göre silinen sayıları döner."""
+    counts = {}
+    for queryset in _child_querysets(user.pk):
+        deleted = _delete_in_chunks(queryset, chunk_size, pause)
+        if deleted:
+            name = queryset.model._meta.verbose_name_plural
+            counts[name] = counts.get(name, 0) + deleted
+
+    @retry_on_locked
+    def delete_user():
+        # Bu arada talep geri alındıysa (ör. yönetici hesabı açtıysa) kullanıcı silinmez
+        if pending_deletions().filter(pk=user.pk).exists():
+            User.objects.get(pk=user.pk).delete()
+            return True
+        return False
+
+    if delete_user():
+        counts['users'] = 1
+    return counts
+
+
+def purge_deleted_accounts(chunk_size=500, pause=0.05):
+    """Silme talebi olan tüm hesapları temizler; (kullanıcı adı, sayılar) listesi döner."""
+    return [
+        (user.username, purge_user(user, chunk_size, pause))
+        for user in pending_deletions().order_by('deletion_requested_at')
+    ]
@@ -0,0 +1,145 @@
+"""
+Tamponlu aktivite logu.
+
+log_activity() kaydı istek içinde veritabanına yazmaz; süreç içi bir tampona
+ekler. Tampon ACTIVITY_LOG_BUFFER_SIZE kayda ulaşınca ya da en eski kayıt
+ACTIVITY_LOG_FLUSH_INTERVAL saniyeyi geçince tek bir bulk_create ile yazılır.
+Arka plandaki zamanlayıcı iş parçacığı sessiz dönemlerde de tamponu boşaltır;
+süreç normal kapanırken (atexit, SIGTERM sonrası çıkış) kalanlar yazılır.
+
+Süreç aniden ölürse (SIGKILL, OOM, güç kesintisi) tampondaki en fazla
+ACTIVITY_LOG_BUFFER_SIZE kayıt ya da son ACTIVITY_LOG_FLUSH_INTERVAL saniyenin
+kayıtları kaybolur. Aktivite logu yalnızca bilgilendirme amaçlıdır; puan ve
+rozetler ayrıca kendi tablolarında tutulduğu için bu kayıp kabul edilebilir.
+
+ACTIVITY_LOG_SYNC=True olduğunda (testler için) her kayıt tampona girmeden
+hemen yazılır; bu kipte geri alınan bir transaction'ın log kaydı kalabilir.
+"""
+import atexit
+import datetime
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+
+from .models import ActivityLog, ActivityRollup
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_buffer = []
+_oldest = None
+_timer = None
+
+
+def log_activity(user, activity_type, description, points_earned=0):
+    entry = ActivityLog(
+        user_id=user.pk,
+        activity_type=activity_type,
+        description=description,
+        points_earned=points_earned,
+        created_at=timezone.now(),
+    )
+    # Senkron kipte kayıt hemen log veritabanına yazılır: on_commit geri çağrıları
+    # TestCase içinde hiç çalışmaz ve log ayrı veritabanında olduğundan 'default'
+    # transaction'ıyla birlikte geri alınamaz zaten
+    if getattr(settings, 'ACTIVITY_LOG_SYNC', False):
+        entry.save(using=settings.LOGS_DATABASE)
+        return
+    # Çağıran transaction geri alınırsa (ör. kilit nedeniyle yeniden deneme) kayıt tampona eklenmez;
+    # kayıt log veritabanına yazılsa da beklenen transaction 'default' üzerindedir
+    transaction.on_commit(lambda: _enqueue(entry), using='default')
+
+
+# Özet kayıtlar için açıklama şablonları
+ROLLUP_DESCRIPTIONS = {
+    'quiz_completed': '{count} quiz tamamladı',
+    'badge_earned': '{count} rozet kazandı',
+    'card_read': '{count} bilgi kartı okudu',
+}
+
+
+def recent_activities(user, limit=10):
+    """
+    Son aktiviteler. Ham kayıtlar saklama süresinden sonra silindiği için
+    yeterli ham kayıt yoksa liste günlük özetlerden tamamlanır.
+    """
+    activities = list(ActivityLog.objects.filter(user=user).order_by('-created_at')[:limit])
+    if len(activities) >= limit:
+        return activities
+
+    oldest = activities[-1].created_at if activities else None
+    rollups = ActivityRollup.objects.filter(user=user)
+    if oldest is not None:
+        rollups = rollups.filter(date__lt=timezone.localdate(oldest))
+    for rollup in rollups.order_by('-date', 'activity_type')[:limit - len(activities)]:
+        template = ROLLUP_DESCRIPTIONS.get(rollup.activity_type, '{count} aktivite')
+        activities.append(ActivityLog(
+            user_id=rollup.user_id,
+            activity_type=rollup.activity_type,
+            description=template.format(count=rollup.count),
+            points_earned=rollup.points_earned,
+            created_at=timezone.make_aware(datetime.datetime.combine(rollup.date, datetime.time.min)),
+        ))
+    return activities
+
+
+def _enqueue(entry):
+    global _oldest
+    with _lock:
+        _buffer.append(entry)
+        if _oldest is None:
+            _oldest = time.monotonic()
+        should_flush = (
+            len(_buffer) >= settings.ACTIVITY_LOG_BUFFER_SIZE
+            or time.monotonic() - _oldest >= settings.ACTIVITY_LOG_FLUSH_INTERVAL
+        )
+    _ensure_timer()
+    if should_flush:
+        flush()
+
+
+def flush():
+    """Tampondaki tüm kayıtları tek seferde yazar; yazılan kayıt sayısını döner."""
+    global _oldest
+    with _lock:
+        entries = _buffer[:]
+        _buffer.clear()
+        _oldest = None
+    if not entries:
+        return 0
+    try:
+        ActivityLog.objects.bulk_create(entries, batch_size=500)
+    except Exception:
+        logger.exception('Aktivite logu yazılamadı; %d kayıt kaybedildi', len(entries))
+        return 0
+    return len(entries)
+
+
+def _flush_periodically():
+    while True:
+        time.sleep(settings.ACTIVITY_LOG_FLUSH_INTERVAL)
+        try:
+            flush()
+        finally:
+            # Bu iş parçacığının bağlantısı CONN_MAX_AGE'e göre kapatılır
+            close_old_connections()
+
+
+def _ensure_timer():
+    global _timer
+    if _timer is not None and _timer.is_alive():
+        return
+    with _lock:
+        if _timer is None or not _timer.is_alive():
+            _timer = threading.Thread(target=_flush_periodically, name='activity-log-flush', daemon=True)
+            _timer.start()
+
+
+@atexit.register
+def _flush_at_exit():
+    flush()
+    connections.close_all()
@@ -1,5 +1,130 @@
-from django.contrib import admin
+from datetime import timedelta
+
+from django import forms
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.core.paginator import Paginator
+from django.db.models import Max
+from django.shortcuts import redirect, render
+from django.urls import path
+from django.utils import timezone
 from .models import *
+from .importer import detect_format, import_file, open_text
+from .jobs import requeue
+
+
+# Büyük tablolar için sayfalama: filtresiz listede COUNT(*) yerine en büyük id
+# (birincil anahtar indeksinden tek okuma) tahmini toplam olarak kullanılır.
+# Silinen kayıtlar nedeniyle son sayfalar boş görünebilir; filtreli listelerde
+# (tarih aralığı, arama) gerçek sayı alınır.
+class EstimatedCountPaginator(Paginator):
+    @property
+    def count(self):
+        if '_count' not in self.__dict__:
+            queryset = self.object_list
+            if queryset.query.where:
+                self._count = queryset.count()
+            else:
+                self._count = queryset.aggregate(estimate=Max('pk'))['estimate'] or 0
+        return self._count
+
+
+# Kullanıcı adına göre filtre: kenar çubuğunda tüm kullanıcıları listelemek yerine
+# kullanıcı adı kutusu gösterilir (tekil username indeksiyle aranır)
+class UsernameFilter(admin.SimpleListFilter):
+    template = 'admin/main/username_filter.html'
+    field_name = None
+    
+    def lookups(self, request, model_admin):
+        return ()
+    
+    def has_output(self):
+        return True
+    
+    def choices(self, changelist):
+        yield {
+            'parameter_name': self.parameter_name,
+            'value': self.value() or '',
+            'hidden': [
+                (key, value) for key, value in changelist.params.items()
+                if key != self.parameter_name
+            ],
+            'reset_query_string': changelist.get_query_string(remove=[self.parameter_name]),
+        }
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{f'{self.field_name}__username': self.value().strip()})
+        return queryset
+
+
+class ParentUsernameFilter(UsernameFilter):
+    title = 'Veli'
+    parameter_name = 'parent_username'
+    field_name = 'parent'
+
+
+class StudentUsernameFilter(UsernameFilter):
+    title = 'Öğrenci'
+    parameter_name = 'student_username'
+    field_name = 'student'
+
+
+# Son N gün filtresi: date_hierarchy filtresiz listede tüm satırlarda
+# SELECT DISTINCT django_datetime_trunc(...) çalıştırır (her satır için Python
+# fonksiyonu); aralık filtresi ise tarih indeksinde `>=` taramasıdır
+class RecentFilter(admin.SimpleListFilter):
+    title = 'Tarih'
+    parameter_name = 'recent'
+    field_name = None
+    RANGES = (
+        ('1', 'Son 24 saat'),
+        ('7', 'Son 7 gün'),
+        ('30', 'Son 30 gün'),
+        ('365', 'Son 1 yıl'),
+    )
+    
+    def lookups(self, request, model_admin):
+        return self.RANGES
+    
+    def queryset(self, request, queryset):
+        if self.value() in dict(self.RANGES):
+            since = timezone.now() - timedelta(days=int(self.value()))
+            return queryset.filter(**{f'{self.field_name}__gte': since})
+        return queryset
+
+
+class CompletedAtFilter(RecentFilter):
+    field_name = 'completed_at'
+
+
+class AnsweredAtFilter(RecentFilter):
+    field_name = 'answered_at'
+
+
+class CreatedAtFilter(RecentFilter):
+    field_name = 'created_at'
+
+
+# activity_type seçeneksiz bir alan: varsayılan filtre tüm log tablosunda
+# SELECT DISTINCT çalıştırır; bilinen türler sabit listeden gösterilir
+class ActivityTypeFilter(admin.SimpleListFilter):
+    title = 'Aktivite türü'
+    parameter_name = 'activity_type'
+    
+    def lookups(self, request, model_admin):
+        return (
+            ('quiz_completed', 'Quiz tamamlama'),
+            ('badge_earned', 'Rozet kazanma'),
+            ('card_read', 'Bilgi kartı'),
+            ('level_up', 'Seviye atlama'),
+        )
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(activity_type=self.value())
+        return queryset
+
 
 # User Admin
 @admin.register(User)
@@ -14,7 +139,10 @@ class UserAdmin(admin.ModelAdmin):
 @admin.register(ParentStudent)
 class ParentStudentAdmin(admin.ModelAdmin):
     list_display = ('parent', 'student')
-    list_filter = ('parent', 'student')
+    list_filter = (ParentUsernameFilter, StudentUsernameFilter)
+    list_select_related = ('parent', 'student')
+    search_fields = ('parent__username', 'student__username')
+    autocomplete_fields = ('parent', 'student')
 
 
 # Category Admin
@@ -53,6 +181,16 @@ class QuestionAdmin(admin.ModelAdmin):
     question_text_short.short_description = 'Soru'
 
 
+# İçe Aktarma Formu
+class ImportForm(forms.Form):
+    file = forms.FileField(label='Dosya', help_text='JSON Lines (.jsonl) ya da CSV (.csv)')
+    format = forms.ChoiceField(
+        label='Biçim',
+        choices=(('', 'Dosya uzantısından'), ('jsonl', 'JSON Lines'), ('csv', 'CSV')),
+        required=False,
+    )
+
+
 # Quiz Admin
 @admin.register(Quiz)
 class QuizAdmin(admin.ModelAdmin):
@@ -61,10 +199,45 @@ class QuizAdmin(admin.ModelAdmin):
     search_fields = ('title', 'description')
     inlines = [QuestionInline]
     
+    change_list_template = 'admin/main/quiz/change_list.html'
+    
     def save_model(self, request, obj, form, change):
         if not obj.created_by:
             obj.created_by = request.user
         super().save_model(request, obj, form, change)
+    
+    def get_urls(self):
+        urls = [
+            path('import/', self.admin_site.admin_view(self.import_view), name='main_quiz_import'),
+        ]
+        return urls + super().get_urls()
+    
+    # Toplu içe aktarma (JSON Lines / CSV, bkz. main/importer.py)
+    def import_view(self, request):
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+        
+        form = ImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            upload = form.cleaned_data['file']
+            fmt = form.cleaned_data['format'] or detect_format(upload.name)
+            report = import_file(open_text(upload.file), fmt, created_by=request.user)
+            
+            level = messages.WARNING if report.errors else messages.SUCCESS
+            self.message_user(request, report.summary(), level)
+            for line_no, message in report.errors[:20]:
+                self.message_user(request, f'Satır {line_no}: {message}', messages.ERROR)
+            if len(report.errors) > 20:
+                self.message_user(request, f'... ve {len(report.errors) - 20} hata daha', messages.ERROR)
+            return redirect('admin:main_quiz_changelist')
+        
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'form': form,
+            'title': 'Quiz bankası içe aktar',
+        }
+        return render(request, 'admin/main/quiz/import.html', context)
 
 
 # Badge Admin
@@ -88,9 +261,13 @@ class UserBadgeAdmin(admin.ModelAdmin):
 @admin.register(QuizAttempt)
 class QuizAttemptAdmin(admin.ModelAdmin):
     list_display = ('user', 'quiz', 'percentage', 'is_passed', 'time_spent_min', 'completed_at')
-    list_filter = ('is_passed', 'quiz__category', 'completed_at')
+    list_filter = (CompletedAtFilter, 'is_passed', 'quiz__category')
     search_fields = ('user__username', 'quiz__title')
     ordering = ('-completed_at',)
+    list_select_related = ('user', 'quiz')
+    raw_id_fields = ('user', 'quiz')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     def time_spent_min(self, obj):
         if obj.time_spent:
@@ -103,7 +280,12 @@ class QuizAttemptAdmin(admin.ModelAdmin):
 @admin.register(UserAnswer)
 class UserAnswerAdmin(admin.ModelAdmin):
     list_display = ('attempt', 'question_short', 'selected_answer_short', 'is_correct')
-    list_filter = ('is_correct', 'answered_at')
+    list_filter = (AnsweredAtFilter, 'is_correct')
+    # Deneme adı kullanıcı ve quiz başlığından oluşur; hepsi tek sorguda gelir
+    list_select_related = ('attempt__user', 'attempt__quiz', 'question', 'selected_answer')
+    raw_id_fields = ('attempt', 'question', 'selected_answer')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     def question_short(self, obj):
         return obj.question.question_text[:30]
@@ -118,9 +300,26 @@ class UserAnswerAdmin(admin.ModelAdmin):
 @admin.register(ActivityLog)
 class ActivityLogAdmin(admin.ModelAdmin):
     list_display = ('user', 'activity_type', 'description', 'points_earned', 'created_at')
-    list_filter = ('activity_type', 'created_at')
-    search_fields = ('user__username', 'description')
+    list_filter = (CreatedAtFilter, ActivityTypeFilter)
+    search_fields = ('description',)
     ordering = ('-created_at',)
+    raw_id_fields = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # Kullanıcılar başka veritabanında: JOIN yerine ayrı sorguyla önden yüklenir
+    list_select_related = ()
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('user')
+    
+    # Loglar ayrı veritabanında; kullanıcı adı araması JOIN yerine id listesiyle yapılır
+    def get_search_results(self, request, queryset, search_term):
+        queryset, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term:
+            user_ids = list(User.objects.filter(username__icontains=search_term).values_list('id', flat=True)[:500])
+            if user_ids:
+                queryset |= self.model.objects.filter(user_id__in=user_ids)
+        return queryset, may_have_duplicates
     
     # Contact Message Admin
 @admin.register(ContactMessage)
@@ -153,4 +352,33 @@ class UserCardReadAdmin(admin.ModelAdmin):
 class DailyCardLimitAdmin(admin.ModelAdmin):
     list_display = ('user', 'date', 'cards_read_today')
     list_filter = ('date',)
-    search_fields = ('user__username',)
\ No newline at end of file
+    search_fields = ('user__username',)
+
+
+
+# Puan Defteri (yalnızca eklenir; düzeltmeler yeni kayıtla yapılır, bkz. main/points.py)
+@admin.register(PointsEntry)
+class PointsEntryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'amount', 'reason', 'description', 'created_at')
+    list_filter = ('reason',)
+    search_fields = ('user__username', 'description')
+    raw_id_fields = ('user',)
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+# Arka Plan İşleri (başarısız işler burada görülür ve tekrar sıraya alınabilir)
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'status', 'priority', 'attempts', 'max_attempts', 'run_at', 'locked_by')
+    list_filter = ('status', 'name')
+    readonly_fields = ('locked_until', 'locked_by', 'last_error', 'created_at')
+    actions = ['requeue_jobs']
+    
+    @admin.action(description='Seçili başarısız işleri tekrar sıraya al')
+    def requeue_jobs(self, request, queryset):
+        count = requeue(queryset)
+        self.message_user(request, f'{count} iş tekrar sıraya alındı.')
@@ -0,0 +1,195 @@
+"""
+Mobil istemci için salt okunur JSON katalog API'si.
+
+- Sayfalama imleç (cursor) ile yapılır: `?limit=` ve yanıttaki `next` adresi.
+- `?fields=id,title` ile yalnızca istenen alanlar döner (ve sorgulanır).
+- ETag katalog sürüm damgasından üretilir; `If-None-Match` eşleşirse 304
+  döner ve katalog sorguları hiç çalıştırılmaz.
+"""
+import base64
+import functools
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Q
+from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_safe
+
+from .cache import get_version
+from .models import Category, Quiz
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+CATEGORY_FIELDS = ('id', 'name', 'description', 'icon', 'color', 'order', 'quiz_count')
+QUIZ_FIELDS = (
+    'id', 'category', 'title', 'description', 'difficulty', 'passing_score',
+    'time_limit', 'points_reward', 'created_at', 'question_count',
+)
+# Veritabanı sütunu olmayan, istenirse hesaplanan alanlar
+ANNOTATIONS = {
+    'quiz_count': Count('quizzes', filter=Q(quizzes__is_published=True)),
+    'question_count': Count('questions'),
+}
+# API alan adı -> sorgu alanı
+FIELD_SOURCES = {'category': 'category_id'}
+
+
+class ApiError(Exception):
+    pass
+
+
+def _catalog_etag(request, *args, **kwargs):
+    return f'catalog-{get_version("catalog")}'
+
+
+def catalog_endpoint(view_func):
+    """GET/HEAD dışını reddeder, katalog ETag'i ile koşullu istekleri yanıtlar."""
+    @functools.wraps(view_func)
+    def cached(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        # İstemci her seferinde ETag ile doğrulasın (304 ucuz)
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    conditional = condition(etag_func=_catalog_etag)(cached)
+
+    @functools.wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        try:
+            response = conditional(request, *args, **kwargs)
+        except ApiError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        # Hata yanıtları ETag taşımaz (istemci hatayı önbelleğe almasın)
+        if response.status_code >= 400 and response.has_header('ETag'):
+            del response['ETag']
+        return response
+    return require_safe(wrapper)
+
+
+def _json(data):
+    return JsonResponse(data, json_dumps_params={'ensure_ascii': False})
+
+
+# Alan seçimi
+def _selected_fields(request, allowed):
+    raw = request.GET.get('fields', '').strip()
+    if not raw:
+        return list(allowed)
+    fields = [field.strip() for field in raw.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ApiError(f'Bilinmeyen alan: {", ".join(unknown)}')
+    return fields
+
+
+def _values(queryset, fields, key_fields=()):
+    """Yalnızca istenen alanları (ve sayfalama anahtarlarını) sorgular."""
+    annotations = {name: ANNOTATIONS[name] for name in fields if name in ANNOTATIONS}
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+    columns = {FIELD_SOURCES.get(field, field) for field in fields} | set(key_fields)
+    return queryset.values(*columns)
+
+
+def _serialize(row, fields):
+    return {field: row[FIELD_SOURCES.get(field, field)] for field in fields}
+
+
+# İmleçli sayfalama
+def _encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor, model, key_fields):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ApiError('Geçersiz imleç')
+    if not isinstance(values, list) or len(values) != len(key_fields):
+        raise ApiError('Geçersiz imleç')
+    # Her değer anahtar alanının tipine çevrilir; filtreye yalnızca geçerli değerler gider
+    decoded = []
+    for field, value in zip(key_fields, values):
+        if not isinstance(value, (str, int)) or isinstance(value, bool):
+            raise ApiError('Geçersiz imleç')
+        try:
+            decoded.append(model._meta.get_field(field).to_python(value))
+        except (ValidationError, ValueError, TypeError):
+            raise ApiError('Geçersiz imleç')
+    return decoded
+
+
+def _after(key_fields, values):
+    """(a, b, c) > (x, y, z) koşulunu ORM filtresine çevirir."""
+    condition_q = Q()
+    for i, field in enumerate(key_fields):
+        step = Q(**{f'{field}__gt': values[i]})
+        for previous, value in zip(key_fields[:i], values[:i]):
+            step &= Q(**{previous: value})
+        condition_q |= step
+    return condition_q
+
+
+def _limit(request):
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError('Geçersiz limit')
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def _paginate(request, queryset, key_fields, fields):
+    limit = _limit(request)
+    cursor = request.GET.get('cursor')
+    queryset = queryset.order_by(*key_fields)
+    if cursor:
+        queryset = queryset.filter(_after(key_fields, _decode_cursor(cursor, queryset.model, key_fields)))
+
+    # Bir fazla kayıt çekilir: varsa sonraki sayfa vardır
+    rows = list(_values(queryset, fields, key_fields)[:limit + 1])
+    next_url = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        params = request.GET.copy()
+        params['cursor'] = _encode_cursor([rows[-1][field] for field in key_fields])
+        next_url = request.build_absolute_uri(f'{request.path}?{params.urlencode()}')
+
+    return _json({
+        'results': [_serialize(row, fields) for row in rows],
+        'next': next_url,
+    })
+
+
+# Kategoriler
+@catalog_endpoint
+def category_list(request):
+    fields = _selected_fields(request, CATEGORY_FIELDS)
+    return _paginate(request, Category.objects.all(), ('order', 'name', 'id'), fields)
+
+
+# Quiz'ler
+def _published_quizzes():
+    return Quiz.objects.filter(is_published=True)
+
+
+@catalog_endpoint
+def quiz_list(request):
+    fields = _selected_fields(request, QUIZ_FIELDS)
+    queryset = _published_quizzes()
+    category_id = request.GET.get('category')
+    if category_id:
+        if not category_id.isdigit():
+            raise ApiError('Geçersiz kategori')
+        queryset = queryset.filter(category_id=category_id)
+    return _paginate(request, queryset, ('id',), fields)
+
+
+@catalog_endpoint
+def quiz_detail(request, quiz_id):
+    fields = _selected_fields(request, QUIZ_FIELDS)
+    row = _values(_published_quizzes(), fields).filter(id=quiz_id).first()
+    if row is None:
+        return JsonResponse({'error': 'Quiz bulunamadı'}, status=404)
+    return _json(_serialize(row, fields))
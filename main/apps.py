@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class MainConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .db import configure_sqlite
+        from . import signals, tasks  # noqa: F401
+
+        connection_created.connect(configure_sqlite, dispatch_uid='main.configure_sqlite')
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from .cache import user_cache_key
+
+
+# Oturumdaki kullanıcıyı her istekte veritabanından değil önbellekten yükler.
+# Kullanıcı kaydedilince/silinince önbellek main/signals.py içinde temizlenir.
+class CachedModelBackend(ModelBackend):
+    def get_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+            return user
+        return user if self.user_can_authenticate(user) else None
+
+    # Async görünümler (request.auser) için; ModelBackend.aget_user önbelleği kullanmaz
+    async def aget_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = await cache.aget(key)
+        if user is None:
+            user = await super().aget_user(user_id)
+            if user is not None:
+                await cache.aset(key, user, settings.USER_CACHE_TIMEOUT)
+            return user
+        return user if self.user_can_authenticate(user) else None
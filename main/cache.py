@@ -0,0 +1,136 @@
+"""
+Önbellek yardımcıları: sürüm damgaları, anonim kullanıcılar için tam sayfa
+önbelleği ve sürüm damgalarından üretilen koşullu GET (ETag / Last-Modified).
+"""
+import functools
+import hashlib
+import re
+import time
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
+
+from . import metrics
+
+# Önbellekteki sayfalarda CSRF token'ı yerine geçen işaret; her istekte yeni token yazılır
+CSRF_PLACEHOLDER = '__kesfet_csrf_token__'
+CSRF_INPUT_RE = re.compile(r'name="csrfmiddlewaretoken" value="([A-Za-z0-9]+)"')
+
+
+# Sürüm damgaları
+def get_version(name):
+    """
+    Adı verilen verinin son değişiklik zamanı (ms). Damga önbellekte yoksa
+    "şimdi" kabul edilir; bu da ona bağlı tüm önbellek kayıtlarını geçersiz kılar.
+    """
+    key = f'version:{name}'
+    version = cache.get(key)
+    if version is None:
+        version = int(time.time() * 1000)
+        cache.add(key, version, timeout=None)
+        version = cache.get(key, version)
+    return version
+
+
+def bump_version(name):
+    cache.set(f'version:{name}', int(time.time() * 1000), timeout=None)
+
+
+# Oturum kullanıcısı önbelleği (main/backends.py)
+def user_cache_key(user_id):
+    return f'user:{user_id}'
+
+
+def invalidate_user(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
+# Anonim kullanıcılar için tam sayfa önbelleği
+def cache_page_for_anonymous(view_func):
+    """
+    Giriş yapmamış kullanıcıların GET isteklerini katalog sürümü ve dile göre önbellekler.
+    Bekleyen mesaj varsa ya da görünüm çerez ayarlıyorsa önbelleğe alınmaz.
+    """
+    @functools.wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if (
+            request.method != 'GET'
+            or request.user.is_authenticated
+            or len(messages.get_messages(request))
+        ):
+            return view_func(request, *args, **kwargs)
+
+        path_hash = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        key = f'page:{get_version("catalog")}:{get_language()}:{path_hash}'
+        cached = cache.get(key)
+        metrics.record_cache_lookup('page', cached is not None)
+        if cached is not None:
+            content, content_type = cached
+            if CSRF_PLACEHOLDER in content:
+                content = content.replace(CSRF_PLACEHOLDER, get_token(request))
+            return HttpResponse(content, content_type=content_type)
+
+        response = view_func(request, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming and not response.cookies:
+            content = response.content.decode(response.charset)
+            tokens = set(CSRF_INPUT_RE.findall(content))
+            for token in tokens:
+                content = content.replace(token, CSRF_PLACEHOLDER)
+            cache.set(key, (content, response['Content-Type']), settings.PAGE_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
+
+
+# Koşullu GET
+def user_pages_version(user_id):
+    return f'user-pages:{user_id}'
+
+
+def conditional_page(*stamps):
+    """
+    Sayfanın ETag ve Last-Modified değerini, sayfayı oluşturmadan, bağlı olduğu
+    sürüm damgalarından hesaplar; istemcideki kopya güncelse 304 döner.
+    `stamps` içindeki '{user}' giriş yapan kullanıcının id'si ile değiştirilir.
+    Giriş yapan kullanıcının kendi damgası (menüdeki puan, avatar, tema) her zaman eklenir.
+    """
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or len(messages.get_messages(request)):
+                return view_func(request, *args, **kwargs)
+
+            names = [name.format(user=request.user.pk) for name in stamps]
+            if request.user.is_authenticated:
+                names.append(user_pages_version(request.user.pk))
+            versions = [get_version(name) for name in names]
+            # Sayfadaki CSRF token'ı çerezdeki sırra bağlıdır; sır değişirse sayfa da değişmiş sayılır
+            fingerprint = '|'.join([
+                request.get_full_path(),
+                get_language() or '',
+                request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+                *(f'{name}={version}' for name, version in zip(names, versions)),
+            ])
+            etag = quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+            last_modified = max(versions) // 1000
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            metrics.record_cache_lookup('conditional', response is not None)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response.headers.setdefault('ETag', etag)
+            response.headers.setdefault('Last-Modified', http_date(last_modified))
+            # Kişiye özel sayfalar: paylaşılan önbelleklerde tutulmaz, her seferinde doğrulanır
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return wrapper
+    return decorator
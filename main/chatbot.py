@@ -0,0 +1,109 @@
+"""
+KesfetBot (Gemini) sohbet görünümü.
+
+Google SDK'sı (google.generativeai; grpc, protobuf ve API istemcisini de
+yükler) modül yüklenirken değil ilk sohbet isteğinde içe aktarılır. Böylece
+sohbet kullanılmayan worker'lar açılışta bu paketlere zaman ve bellek
+harcamaz (bkz. check_import_budget).
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import render
+
+from . import metrics
+from .models import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = 'gemini-2.0-flash'
+
+_configured_key = None
+
+
+def get_model():
+    global _configured_key
+    import google.generativeai as genai
+    
+    # Anahtar değişmedikçe yapılandırma tekrarlanmaz
+    if _configured_key != settings.GEMINI_API_KEY:
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        _configured_key = settings.GEMINI_API_KEY
+    return genai.GenerativeModel(MODEL_NAME)
+
+
+# Sohbet
+@login_required
+def chatbot_view(request):
+    if request.method == 'POST':
+        try:
+            user_message = request.POST.get('message', '').strip()
+            
+            if not user_message:
+                return JsonResponse({
+                    'error': 'Mesaj boş olamaz!'
+                }, status=400)
+            
+            # Gemini modeli (SDK ilk kullanımda yüklenir)
+            model = get_model()
+            
+            # KISA Sistem promptu
+            system_prompt = f"""Sen KesfetBot'sun 🤖 - Çocuklar için eğlenceli AI asistan.
+
+ÖNEMLI KURALLAR:
+- Cevapların MAKSIMUM 3-4 CÜMLE olmalı
+- Çok kısa ve öz açıkla
+- Sade Türkçe kullan
+- 2-3 emoji yeterli
+
+Kullanıcı: {request.user.username} ({request.user.total_points} puan)
+
+Soru: {user_message}
+
+KISA cevap ver!"""
+            
+            # AI'dan cevap al
+            start = time.perf_counter()
+            try:
+                response = model.generate_content(system_prompt)
+                ai_response = response.text
+            except Exception:
+                metrics.inc('kesfet_gemini_errors_total', {'model': MODEL_NAME})
+                raise
+            finally:
+                metrics.observe('kesfet_gemini_request_duration_seconds', time.perf_counter() - start, {'model': MODEL_NAME})
+            
+            usage = getattr(response, 'usage_metadata', None)
+            if usage is not None:
+                metrics.inc('kesfet_gemini_tokens_total', {'model': MODEL_NAME, 'kind': 'prompt'}, usage.prompt_token_count or 0)
+                metrics.inc('kesfet_gemini_tokens_total', {'model': MODEL_NAME, 'kind': 'completion'}, usage.candidates_token_count or 0)
+            
+            # Mesajı kaydet
+            ChatMessage.objects.create(
+                user=request.user,
+                message=user_message,
+                response=ai_response
+            )
+            
+            return JsonResponse({
+                'success': True,
+                'response': ai_response
+            })
+            
+        except Exception as e:
+            logger.exception('Chatbot hatası')
+            return JsonResponse({
+                'error': f'Bir hata oluştu: {str(e)}'
+            }, status=500)
+    
+    # GET request - chat geçmişini göster
+    chat_history = ChatMessage.objects.filter(user=request.user).order_by('-created_at')[:20]
+    
+    context = {
+        'chat_history': chat_history,
+    }
+    
+    return render(request, 'chatbot.html', context)
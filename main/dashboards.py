@@ -0,0 +1,206 @@
+"""
+Panoların sorguları ve async sürümleri.
+
+Her pano birbirinden bağımsız sorgulardan oluşur (`*_queries` isim -> fonksiyon
+döner). Senkron görünümler (main/views.py) bunları sırayla çalıştırır; async
+görünümler ASGI (config/asgi.py) altında `fan_out` ile aynı anda çalıştırır.
+
+Django'nun async ORM'i (acount, aget, async for) sorguları tek bir thread'de
+sırayla çalıştırır; bu yüzden bağımsız sorgular ayrı thread'lere dağıtılır. Her
+thread kendi veritabanı bağlantısını tutar; WAL modunda okuyucular birbirini
+beklemez. Thread sayısı DASHBOARD_QUERY_THREADS ile sınırlıdır.
+
+Havuz thread'leri istek döngüsünün dışında kaldığından bağlantılar her sorgudan
+önce ve sonra close_old_connections ile denetlenir (CONN_MAX_AGE,
+CONN_HEALTH_CHECKS) ve sorgular MetricsMiddleware yerine burada ölçülür.
+"""
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.db import close_old_connections
+from django.db.models import Avg, Count
+from django.shortcuts import render
+from django.utils import timezone
+
+from .activity import recent_activities
+from .middleware import record_db_queries
+from .models import (
+    User, ParentStudent, Quiz, QuizAttempt, UserBadge, UserCardRead, DailyCardLimit, KnowledgeCard,
+)
+
+
+# Sorgular
+def student_queries(user):
+    week_ago = timezone.now() - timedelta(days=7)
+    completed = QuizAttempt.objects.filter(user=user, completed_at__isnull=False)
+    return {
+        'total_attempts': completed.count,
+        'passed_quizzes': QuizAttempt.objects.filter(user=user, is_passed=True).count,
+        'total_quizzes': Quiz.objects.filter(is_published=True).count,
+        'recent_attempts': lambda: list(completed.select_related('quiz').order_by('-completed_at')[:5]),
+        'user_badges': lambda: list(
+            UserBadge.objects.filter(user=user).select_related('badge').order_by('-earned_at')
+        ),
+        'recent_activities': lambda: recent_activities(user, limit=10),
+        'weekly_attempts': completed.filter(completed_at__gte=week_ago).count,
+        'daily_limit': DailyCardLimit.objects.filter(user=user, date=date.today()).first,
+        'total_cards_read': UserCardRead.objects.filter(user=user).count,
+        'total_cards': KnowledgeCard.objects.filter(is_active=True).count,
+    }
+
+
+def student_context(results):
+    total_attempts = results['total_attempts']
+    passed_quizzes = results['passed_quizzes']
+    daily_limit = results['daily_limit']
+    return {
+        'total_attempts': total_attempts,
+        'passed_quizzes': passed_quizzes,
+        'total_quizzes': results['total_quizzes'],
+        'success_rate': (passed_quizzes / total_attempts * 100) if total_attempts > 0 else 0,
+        'recent_attempts': results['recent_attempts'],
+        'user_badges': results['user_badges'],
+        'recent_activities': results['recent_activities'],
+        'weekly_attempts': results['weekly_attempts'],
+        # Günün Bilgisi
+        'daily_cards_today': daily_limit.cards_read_today if daily_limit else 0,
+        'total_cards_read': results['total_cards_read'],
+        'cards_remaining': results['total_cards'] - results['total_cards_read'],
+    }
+
+
+def parent_queries(children):
+    week_ago = timezone.now() - timedelta(days=7)
+    queries = {}
+    for child in children:
+        completed = QuizAttempt.objects.filter(user=child, completed_at__isnull=False)
+        queries.update({
+            (child.id, 'total_attempts'): completed.count,
+            (child.id, 'passed_quizzes'): QuizAttempt.objects.filter(user=child, is_passed=True).count,
+            (child.id, 'recent_quiz'): completed.order_by('-completed_at').first,
+            (child.id, 'weekly_quizzes'): completed.filter(completed_at__gte=week_ago).count,
+        })
+    return queries
+
+
+def parent_context(children, results):
+    children_data = []
+    for child in children:
+        total_attempts = results[(child.id, 'total_attempts')]
+        passed = results[(child.id, 'passed_quizzes')]
+        children_data.append({
+            'child': child,
+            'total_attempts': total_attempts,
+            'passed_quizzes': passed,
+            'success_rate': (passed / total_attempts * 100) if total_attempts > 0 else 0,
+            'recent_quiz': results[(child.id, 'recent_quiz')],
+            'weekly_quizzes': results[(child.id, 'weekly_quizzes')],
+        })
+    return {'children_data': children_data}
+
+
+def teacher_queries(user):
+    attempts = QuizAttempt.objects.filter(quiz__created_by=user, completed_at__isnull=False)
+    return {
+        'total_students': User.objects.filter(role='student').count,
+        'total_quizzes': Quiz.objects.filter(created_by=user).count,
+        'total_attempts': attempts.count,
+        'recent_attempts': lambda: list(attempts.select_related('user', 'quiz').order_by('-completed_at')[:10]),
+        'my_quizzes': lambda: list(Quiz.objects.filter(created_by=user).annotate(
+            attempt_count=Count('attempts'),
+            avg_score=Avg('attempts__percentage')
+        )),
+    }
+
+
+# Çalıştırma
+def run_all(queries):
+    return {name: query() for name, query in queries.items()}
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.DASHBOARD_QUERY_THREADS, thread_name_prefix='dashboard'
+            )
+        return _executor
+
+
+def _run_in_thread(query):
+    # Django bağlantıları context'e bağlıdır; isteğin context'i kopyalanırsa tüm
+    # thread'ler aynı bağlantıyı paylaşırdı. Her thread kendi context'ini (ve
+    # dolayısıyla kendi kalıcı bağlantısını) kullanır.
+    if not hasattr(_thread_state, 'context'):
+        _thread_state.context = contextvars.Context()
+    return _thread_state.context.run(_run_query, query)
+
+
+def _run_query(query):
+    # request_started/request_finished bu thread'de tetiklenmez: eskiyen ya da
+    # bozulan bağlantılar burada kapatılır
+    close_old_connections()
+    try:
+        with record_db_queries():
+            return query()
+    finally:
+        close_old_connections()
+
+
+async def fan_out(queries):
+    """Bağımsız sorguları aynı anda çalıştırır; sonuçları aynı anahtarlarla döner."""
+    run = sync_to_async(_run_in_thread, thread_sensitive=False, executor=_get_executor())
+    results = await asyncio.gather(*(run(query) for query in queries.values()))
+    return dict(zip(queries, results))
+
+
+# Async Görünümler
+@login_required
+async def dashboard(request):
+    user = await request.auser()
+    if user.role == 'student':
+        return await student_dashboard(request)
+    elif user.role == 'parent':
+        return await parent_dashboard(request)
+    elif user.role == 'teacher':
+        return await teacher_dashboard(request)
+
+    return await sync_to_async(render)(request, 'dashboard.html')
+
+
+@login_required
+async def student_dashboard(request):
+    user = await request.auser()
+    context = student_context(await fan_out(student_queries(user)))
+    # Şablon ve context işlemcileri senkron çalışır (request.user vb.)
+    return await sync_to_async(render)(request, 'student_dashboard.html', context)
+
+
+@login_required
+async def parent_dashboard(request):
+    user = await request.auser()
+    children = [
+        relation.student
+        async for relation in ParentStudent.objects.filter(parent=user).select_related('student')
+    ]
+    context = parent_context(children, await fan_out(parent_queries(children)))
+    return await sync_to_async(render)(request, 'parent_dashboard.html', context)
+
+
+@login_required
+async def teacher_dashboard(request):
+    user = await request.auser()
+    context = await fan_out(teacher_queries(user))
+    return await sync_to_async(render)(request, 'teacher_dashboard.html', context)
@@ -0,0 +1,55 @@
+"""
+SQLite bağlantı ayarları ve kilit çakışmalarında yeniden deneme.
+"""
+import functools
+import random
+import time
+
+from django.conf import settings
+from django.db import OperationalError, connections, transaction
+
+
+# Bağlantı açılınca PRAGMA'ları uygula (connection_created sinyali)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+def is_locked_error(exc):
+    message = str(exc).lower()
+    return 'database is locked' in message or 'database table is locked' in message
+
+
+# Kilit çakışmasında işlemi baştan tekrar dene
+def retry_on_locked(func=None, *, using='default', attempts=None, base_delay=0.05):
+    """
+    Fonksiyonu tek bir transaction.atomic() bloğu içinde çalıştırır ve
+    "database is locked" hatasında üstel bekleme ile yeniden dener.
+    Dışarıda açık bir transaction varsa yeniden denemez; hata dış bloğa bırakılır.
+    """
+    if func is None:
+        return functools.partial(retry_on_locked, using=using, attempts=attempts, base_delay=base_delay)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        max_attempts = attempts or getattr(settings, 'SQLITE_WRITE_RETRIES', 5)
+        for attempt in range(1, max_attempts + 1):
+            try:
+                with transaction.atomic(using=using):
+                    return func(*args, **kwargs)
+            except OperationalError as exc:
+                if (
+                    not is_locked_error(exc)
+                    or attempt == max_attempts
+                    or connections[using].in_atomic_block
+                ):
+                    raise
+                time.sleep(base_delay * (2 ** (attempt - 1)) * (1 + random.random()))
+
+    return wrapper
@@ -0,0 +1,217 @@
+"""
+Öğretmenler için quiz sonuçlarının akış (streaming) halinde CSV/XLSX dışa aktarımı.
+
+Denemeler ve cevaplar iki ayrı sıralı sorgudan `.iterator()` ile parça parça
+okunur ve deneme id'sine göre birleştirilir; satırlar üretildikçe istemciye
+gönderilir. Bellek kullanımı satır sayısından bağımsızdır.
+"""
+import csv
+import datetime
+import zipfile
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+from .models import QuizAttempt, UserAnswer
+
+CHUNK_SIZE = 2000
+
+
+# Satırlar
+def attempt_header(questions):
+    return [
+        'Öğrenci', 'Başlangıç', 'Bitiş', 'Süre (sn)', 'Puan', 'Maks. Puan', 'Yüzde', 'Geçti',
+        *(f'Soru {number}' for number, _ in enumerate(questions, 1)),
+    ]
+
+
+def attempt_rows(quiz, questions, chunk_size=CHUNK_SIZE):
+    """Her tamamlanmış deneme için bir satır; soru sütunlarında doğru/yanlış/boş."""
+    column = {question_id: i for i, question_id in enumerate(questions)}
+    attempts = (
+        QuizAttempt.objects.filter(quiz=quiz, completed_at__isnull=False)
+        .select_related('user')
+        .only('id', 'user__username', 'started_at', 'completed_at', 'time_spent',
+              'score', 'max_score', 'percentage', 'is_passed')
+        .order_by('id')
+        .iterator(chunk_size=chunk_size)
+    )
+    answers = (
+        UserAnswer.objects.filter(attempt__quiz=quiz, attempt__completed_at__isnull=False)
+        .order_by('attempt_id')
+        .values_list('attempt_id', 'question_id', 'is_correct')
+        .iterator(chunk_size=chunk_size)
+    )
+
+    pending = next(answers, None)
+    for attempt in attempts:
+        marks = [''] * len(questions)
+        # Cevaplar deneme id'sine göre sıralı: bu denemeninkiler ardışık gelir
+        while pending is not None and pending[0] <= attempt.id:
+            attempt_id, question_id, is_correct = pending
+            if attempt_id == attempt.id and question_id in column:
+                marks[column[question_id]] = 'Doğru' if is_correct else 'Yanlış'
+            pending = next(answers, None)
+        yield [
+            attempt.user.username,
+            attempt.started_at,
+            attempt.completed_at,
+            attempt.time_spent,
+            attempt.score,
+            attempt.max_score,
+            round(attempt.percentage, 1),
+            'Evet' if attempt.is_passed else 'Hayır',
+            *marks,
+        ]
+
+
+def _local(value):
+    if isinstance(value, datetime.datetime):
+        return timezone.localtime(value).replace(tzinfo=None)
+    return value
+
+
+# CSV
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def _csv_cell(value):
+    value = _local(value)
+    if isinstance(value, datetime.datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    # Tablolama programlarında formül olarak çalıştırılmasın
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@'):
+        return "'" + value
+    return value
+
+
+def csv_stream(header, rows):
+    writer = csv.writer(_Echo())
+    # Excel'in UTF-8'i tanıması için BOM
+    yield '\ufeff' + writer.writerow(header)
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+# XLSX (tek sayfa, satır içi metinler; zip akış halinde yazılır)
+XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    # Stil 1: tarih-saat biçimi
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm:ss"/></numFmts>'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ),
+}
+
+_EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def _xlsx_cell(value):
+    value = _local(value)
+    if value is None or value == '':
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c><v>{value}</v></c>'
+    if isinstance(value, datetime.datetime):
+        serial = (value - _EXCEL_EPOCH).total_seconds() / 86400
+        return f'<c s="1"><v>{serial:.6f}</v></c>'
+    return f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+
+def _xlsx_row(values):
+    return '<row>' + ''.join(_xlsx_cell(value) for value in values) + '</row>'
+
+
+class _ZipBuffer:
+    """
+    ZipFile'ın yazdığı baytları biriktirir; akıştan her seferinde boşaltılır.
+    seek/tell olmadığından ZipFile dosyayı geri dönmeden (veri tanımlayıcılarıyla) yazar.
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def xlsx_stream(header, rows, sheet_name='Sonuçlar', rows_per_chunk=500):
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_PARTS.items():
+            archive.writestr(name, content)
+        archive.writestr('xl/workbook.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{escape(sheet_name[:31])}" sheetId="1" r:id="rId1"/></sheets>'
+            '</workbook>'
+        ))
+        yield buffer.drain()
+
+        # Sayfa boyutu baştan bilinmez: zip64 ile büyük dosyalar da yazılabilir
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                + _xlsx_row(header)
+            ).encode())
+            for i, row in enumerate(rows, 1):
+                sheet.write(_xlsx_row(row).encode())
+                if i % rows_per_chunk == 0:
+                    yield buffer.drain()
+            sheet.write(b'</sheetData></worksheet>')
+    yield buffer.drain()
@@ -0,0 +1,181 @@
+"""
+Soru görselleri için küçültülmüş kopyalar (varyantlar).
+
+Yüklenen özgün görselden her genişlik için iki dosya üretilir: WebP ve
+özgün biçime yakın bir yedek (saydamlık varsa PNG, yoksa JPEG). Varyantlar
+MEDIA_ROOT altında `variants/<görsel yolu>/<genişlik>.<uzantı>` olarak
+diskte tutulur; dosya adındaki genişlik üretilen görselin gerçek genişliğidir
+(küçük görseller büyütülmez, aynı genişlik tekrar yazılmaz). Üretilen
+varyantların listesi aynı dizindeki `index.json` dosyasına yazılır; özgün
+dosyadan yeni olan liste tekrar üretilmez.
+
+Şablonlar listeyi görsel adına göre önbellekten okur (`available_variants`);
+varyantlar üretildiğinde ya da silindiğinde kayıt `forget_variants` ile silinir.
+
+Üretim istek içinde yapılmaz: kayıt sonrası `image_variants` işi kuyruğa
+eklenir (main/tasks.py), eski görseller `build_image_variants` komutuyla
+işlem havuzunda (ProcessPoolExecutor) toplu olarak üretilir.
+"""
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+
+# ad -> genişlik (piksel)
+VARIANTS = {
+    'thumb': 320,
+    'display': 960,
+}
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+INDEX_NAME = 'index.json'
+CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def _variant_dir(name):
+    return os.path.join('variants', os.path.splitext(name)[0])
+
+
+def _fallback_ext(name):
+    return 'png' if name.lower().endswith(('.png', '.gif')) else 'jpg'
+
+
+def variant_name(name, width, ext):
+    return os.path.join(_variant_dir(name), f'{width}.{ext}').replace(os.sep, '/')
+
+
+def _index_name(name):
+    return os.path.join(_variant_dir(name), INDEX_NAME).replace(os.sep, '/')
+
+
+def _is_fresh(source_path, target_path):
+    try:
+        return os.path.getmtime(target_path) >= os.path.getmtime(source_path)
+    except OSError:
+        return False
+
+
+def _save(image, path, fmt, **options):
+    # Yarım yazılmış dosya sunulmasın: önce geçici dosyaya yazılır
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    image.save(tmp_path, fmt, **options)
+    os.replace(tmp_path, path)
+
+
+def generate_variants(name, media_root=None, force=False):
+    """
+    `name` görselinin varyantlarını üretir; üretilen dosya sayısını döner.
+    İşlem havuzunda çalışabilmesi için yalnızca dosya yollarıyla çalışır.
+    """
+    from PIL import Image, ImageOps
+
+    media_root = str(media_root or settings.MEDIA_ROOT)
+    source_path = os.path.join(media_root, name)
+    index_path = os.path.join(media_root, _index_name(name))
+    if not force and _is_fresh(source_path, index_path):
+        return 0
+
+    fallback_ext = _fallback_ext(name)
+    index = {'webp': [], 'fallback': []}
+    with Image.open(source_path) as original:
+        # Telefon fotoğraflarındaki EXIF yönü piksellere uygulanır
+        original = ImageOps.exif_transpose(original)
+        has_alpha = original.mode in ('RGBA', 'LA') or 'transparency' in original.info
+        original = original.convert('RGBA' if has_alpha else 'RGB')
+
+        for width in sorted(set(VARIANTS.values())):
+            resized = original.copy()
+            # Küçük görseller büyütülmez; gerçek genişlik önceki varyantla aynıysa atlanır
+            resized.thumbnail((width, width * 4), Image.LANCZOS)
+            if index['webp'] and index['webp'][-1][0] == resized.width:
+                continue
+            for ext in ('webp', fallback_ext):
+                target = variant_name(name, resized.width, ext)
+                path = os.path.join(media_root, target)
+                if ext == 'webp':
+                    _save(resized, path, 'WEBP', quality=WEBP_QUALITY, method=4)
+                elif ext == 'png':
+                    _save(resized, path, 'PNG', optimize=True)
+                else:
+                    _save(resized.convert('RGB'), path, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+                index['webp' if ext == 'webp' else 'fallback'].append([resized.width, target])
+
+    # Listede olmayan (önceki üretimden kalan) varyantlar silinir
+    keep = {os.path.basename(target) for entries in index.values() for _, target in entries}
+    directory = os.path.dirname(index_path)
+    for filename in os.listdir(directory):
+        if filename not in keep and filename != INDEX_NAME and not filename.endswith('.tmp'):
+            try:
+                os.remove(os.path.join(directory, filename))
+            except OSError:
+                pass
+    # Liste en son yazılır: varlığı tüm varyantların hazır olduğunu gösterir
+    tmp_path = f'{index_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path)
+    return sum(len(entries) for entries in index.values())
+
+
+def _cache_key(name):
+    return f'image-variants:{hashlib.md5(name.encode()).hexdigest()}'
+
+
+def forget_variants(name):
+    cache.delete(_cache_key(name))
+
+
+def delete_variants(name):
+    shutil.rmtree(os.path.join(str(settings.MEDIA_ROOT), _variant_dir(name)), ignore_errors=True)
+    forget_variants(name)
+
+
+def _read_index(name):
+    try:
+        with default_storage.open(_index_name(name)) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return [], []
+    return tuple(
+        [(width, default_storage.url(target)) for width, target in index.get(kind, [])]
+        for kind in ('webp', 'fallback')
+    )
+
+
+def available_variants(name):
+    """([(genişlik, url), ...] WebP, aynısı yedek biçim); varyantlar henüz üretilmemişse boş listeler."""
+    key = _cache_key(name)
+    variants = cache.get(key)
+    if variants is None:
+        variants = _read_index(name)
+        cache.set(key, variants, CACHE_TIMEOUT)
+    return variants
+
+
+def build_all(names, workers=None, force=False, progress=None):
+    """
+    Görsellerin varyantlarını işlem havuzunda üretir; (üretilen dosya, hatalar) döner.
+    Pillow işleri CPU'ya bağlı olduğundan iş parçacığı yerine ayrı işlemler kullanılır.
+    """
+    generated, errors = 0, []
+    media_root = str(settings.MEDIA_ROOT)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(generate_variants, name, media_root, force): name for name in names}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                errors.append((futures[future], str(e)))
+            else:
+                generated += result
+                if result:
+                    forget_variants(futures[future])
+            if progress:
+                progress(done, len(futures))
+    return generated, errors
@@ -0,0 +1,275 @@
+"""
+Quiz bankası ve bilgi kartı içe aktarma (JSON Lines / CSV).
+
+Her satır tek bir kaydı tanımlar ve `type` sütunu ile türünü belirtir:
+
+    category  name, description, icon, color, order
+    quiz      category, title, description, difficulty, passing_score, time_limit,
+              points_reward, questions_per_attempt, is_published
+    question  category, quiz, order, question_type, question_text, explanation, points
+    answer    category, quiz, question, order, answer_text, is_correct
+    card      title, content, category, icon, is_active
+
+Kayıtlar doğal anahtarlarıyla eşleştirilir (kategori adı; kategori + quiz
+başlığı; quiz + soru sırası; soru + cevap sırası; kart başlığı). Var olan kayıt
+güncellenir, olmayan eklenir; böylece aynı dosya tekrar içe aktarılabilir.
+Boş bırakılan alanlar değiştirilmez. Dosya satır satır okunur ve kayıtlar
+parti parti (her parti kendi transaction'ında) bulk_create/bulk_update ile yazılır.
+"""
+import csv
+import io
+import json
+from collections import Counter
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from . import search
+from .cache import bump_version
+from .db import retry_on_locked
+from .models import Category, Quiz, Question, Answer, KnowledgeCard
+
+# tür -> (model, üst tür, üst FK alanı, anahtar alanı, yazılabilir alanlar)
+TYPES = {
+    'category': (Category, None, None, 'name', ('description', 'icon', 'color', 'order')),
+    'quiz': (Quiz, 'category', 'category', 'title', (
+        'description', 'difficulty', 'passing_score', 'time_limit', 'points_reward', 'questions_per_attempt',
+        'is_published',
+    )),
+    'question': (Question, 'quiz', 'quiz', 'order', ('question_type', 'question_text', 'explanation', 'points')),
+    'answer': (Answer, 'question', 'question', 'order', ('answer_text', 'is_correct')),
+    'card': (KnowledgeCard, None, None, 'title', ('content', 'category', 'icon', 'is_active')),
+}
+# Üst kaydı bulmak için kullanılan sütunlar (sırayla üst türün doğal anahtarı)
+PARENT_COLUMNS = {
+    'quiz': ('category',),
+    'question': ('category', 'quiz'),
+    'answer': ('category', 'quiz', 'question'),
+}
+# Üst kayıtlar önce yazılır
+FLUSH_ORDER = ('category', 'quiz', 'question', 'answer', 'card')
+
+
+class RowError(Exception):
+    pass
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = Counter()
+        self.updated = Counter()
+        self.errors = []  # (satır no, mesaj)
+        self.rows = 0
+
+    def summary(self):
+        parts = [
+            f'{kind}: {self.created[kind]} yeni, {self.updated[kind]} güncellendi'
+            for kind in FLUSH_ORDER
+            if self.created[kind] or self.updated[kind]
+        ]
+        return f'{self.rows} satır okundu, {len(self.errors)} hata. ' + ('; '.join(parts) or 'Değişiklik yok.')
+
+
+# Okuma
+def read_rows(stream, fmt):
+    """(satır no, sözlük) üretir; `stream` metin akışıdır."""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {key.strip(): value for key, value in row.items() if key and value not in (None, '')}
+    else:
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_no, RowError(f'Geçersiz JSON: {e}')
+                continue
+            if not isinstance(row, dict):
+                yield line_no, RowError('Her satır bir JSON nesnesi olmalı')
+                continue
+            yield line_no, {key: value for key, value in row.items() if value not in (None, '')}
+
+
+def detect_format(filename):
+    return 'csv' if filename.lower().endswith('.csv') else 'jsonl'
+
+
+def open_text(fileobj):
+    # Yüklenen ikili dosya bellekte tamamen okunmadan satır satır çözülür
+    return io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+
+
+# Dönüştürme
+def _convert(model, name, value):
+    field = model._meta.get_field(name)
+    if isinstance(field, models.BooleanField) and isinstance(value, str):
+        value = {'true': True, 'false': False, 'evet': True, 'hayır': False}.get(value.strip().lower(), value)
+    try:
+        return field.to_python(value.strip() if isinstance(value, str) else value)
+    except ValidationError as e:
+        raise RowError(f'{name}: {"; ".join(e.messages)}')
+
+
+def _key_value(column, value):
+    # Soru ve cevap sıra numaraları tam sayıdır
+    if column in ('question', 'order'):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise RowError(f'{column}: tam sayı olmalı')
+    return str(value).strip()
+
+
+def _natural_key(kind, row):
+    columns = PARENT_COLUMNS.get(kind, ()) + (TYPES[kind][3],)
+    missing = [column for column in columns if column not in row]
+    if missing:
+        raise RowError(f'Eksik alan: {", ".join(missing)}')
+    return tuple(_key_value(column, row[column]) for column in columns)
+
+
+class Importer:
+    def __init__(self, batch_size=500, progress=None, created_by=None):
+        self.batch_size = batch_size
+        self.progress = progress
+        # Yeni quiz'lerin sahibi (öğretmen dışa aktarımı created_by'a göre yapılır)
+        self.created_by = created_by
+        self.report = ImportReport()
+        self._ids = {kind: {} for kind in TYPES}  # tür -> doğal anahtar -> id
+        self._batch = {kind: {} for kind in TYPES}  # tür -> doğal anahtar -> (satır no, satır)
+        self._pending = 0
+
+    def run(self, rows):
+        for line_no, row in rows:
+            self.report.rows += 1
+            try:
+                if isinstance(row, RowError):
+                    raise row
+                kind = row.get('type')
+                if kind not in TYPES:
+                    raise RowError(f'Bilinmeyen tür: {kind!r}')
+                self._batch[kind][_natural_key(kind, row)] = (line_no, row)
+            except RowError as e:
+                self.report.errors.append((line_no, str(e)))
+                continue
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self.flush()
+        self.flush()
+        self.report.errors.sort()
+
+        # bulk_create sinyal göndermez: katalog önbelleği burada güncellenir
+        # (arama indeksi her partide yalnızca yazılan kayıtlar için güncellenir, bkz. _write)
+        bump_version('catalog')
+        return self.report
+
+    def flush(self):
+        if not self._pending:
+            return
+        # Kilit nedeniyle tekrar denenirse geri alınan partinin id'leri ve sayaçları da geri alınır
+        ids = {kind: dict(known) for kind, known in self._ids.items()}
+        created, updated, errors = self.report.created.copy(), self.report.updated.copy(), len(self.report.errors)
+
+        def write():
+            self._ids = {kind: dict(known) for kind, known in ids.items()}
+            self.report.created, self.report.updated = created.copy(), updated.copy()
+            del self.report.errors[errors:]
+            self._write()
+
+        retry_on_locked(write)()
+        self._batch = {kind: {} for kind in TYPES}
+        self._pending = 0
+        if self.progress:
+            self.progress(self.report)
+
+    def _write(self):
+        written = {}
+        for kind in FLUSH_ORDER:
+            if self._batch[kind]:
+                written[kind] = self._write_kind(kind, self._batch[kind])
+        
+        # Arama indeksi partinin transaction'ında, yalnızca bu partide yazılan kayıtlar için güncellenir
+        question_ids = set(written.get('question', ()))
+        if written.get('quiz'):
+            search.index_objects(Quiz, written['quiz'])
+            # Soru kayıtları quiz başlığını ve yayın durumunu taşır
+            question_ids.update(Question.objects.filter(quiz_id__in=written['quiz']).values_list('id', flat=True))
+        if question_ids:
+            search.index_objects(Question, question_ids)
+        if written.get('card'):
+            search.index_objects(KnowledgeCard, written['card'])
+
+    # Üst kayıt id'leri (önceki partilerde yazılanlar bellekte, diğerleri veritabanından)
+    def _parent_ids(self, kind, keys):
+        known = self._ids[kind]
+        missing = {key for key in keys if key not in known}
+        if missing:
+            model, parent_kind, fk, key_field, _ = TYPES[kind]
+            if parent_kind:
+                parent_ids = self._parent_ids(parent_kind, {key[:-1] for key in missing})
+                lookup = {(parent_ids[key[:-1]], key[-1]): key for key in missing if key[:-1] in parent_ids}
+                queryset = model.objects.filter(**{
+                    f'{fk}_id__in': {parent_id for parent_id, _ in lookup},
+                    f'{key_field}__in': {value for _, value in lookup},
+                }).values_list('id', f'{fk}_id', key_field)
+                for obj_id, parent_id, value in queryset:
+                    if (parent_id, value) in lookup:
+                        known[lookup[(parent_id, value)]] = obj_id
+            else:
+                queryset = model.objects.filter(**{f'{key_field}__in': {key[0] for key in missing}})
+                for obj_id, value in queryset.values_list('id', key_field):
+                    known.setdefault((value,), obj_id)
+        return {key: known[key] for key in keys if key in known}
+
+    def _write_kind(self, kind, batch):
+        model, parent_kind, fk, key_field, fields = TYPES[kind]
+        parent_ids = self._parent_ids(parent_kind, {key[:-1] for key in batch}) if parent_kind else {}
+        existing_ids = self._parent_ids(kind, set(batch))
+        existing = model.objects.in_bulk(existing_ids.values())
+
+        to_create, to_update, changed_fields = [], [], set()
+        for key, (line_no, row) in batch.items():
+            try:
+                if key in existing_ids:
+                    obj = existing[existing_ids[key]]
+                else:
+                    obj = model(**{key_field: key[-1]})
+                    if kind == 'quiz' and self.created_by is not None:
+                        obj.created_by = self.created_by
+                    if parent_kind:
+                        if key[:-1] not in parent_ids:
+                            raise RowError(f'Üst kayıt bulunamadı ({parent_kind}): {" / ".join(map(str, key[:-1]))}')
+                        setattr(obj, f'{fk}_id', parent_ids[key[:-1]])
+                for name in fields:
+                    if name in row:
+                        setattr(obj, name, _convert(model, name, row[name]))
+                        changed_fields.add(name)
+                try:
+                    # Yalnızca içe aktarılan alanlar doğrulanır (ör. created_by formda zorunlu ama boş olabilir)
+                    obj.full_clean(
+                        exclude=[f.name for f in model._meta.fields if f.name not in fields + (key_field,)],
+                        validate_unique=False,
+                    )
+                except ValidationError as e:
+                    raise RowError('; '.join(f'{k}: {" ".join(v)}' for k, v in e.message_dict.items()))
+            except RowError as e:
+                self.report.errors.append((line_no, str(e)))
+                continue
+            (to_update if obj.pk else to_create).append((key, obj))
+
+        model.objects.bulk_create([obj for _, obj in to_create], batch_size=self.batch_size)
+        if to_update and changed_fields:
+            model.objects.bulk_update([obj for _, obj in to_update], sorted(changed_fields), batch_size=self.batch_size)
+        # SQLite bulk_create sonrası id'leri döndürür; sonraki partiler bunları kullanır
+        for key, obj in to_create + to_update:
+            self._ids[kind][key] = obj.pk
+        self.report.created[kind] += len(to_create)
+        self.report.updated[kind] += len(to_update)
+        return [obj.pk for _, obj in to_create + to_update]
+
+
+def import_file(stream, fmt, batch_size=500, progress=None, created_by=None):
+    return Importer(batch_size=batch_size, progress=progress, created_by=created_by).run(read_rows(stream, fmt))
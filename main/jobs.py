@@ -0,0 +1,175 @@
+"""
+Veritabanı tabanlı arka plan iş kuyruğu (broker gerektirmez).
+
+    @job(priority=5)
+    def award_badges(user_id): ...
+
+    enqueue('award_badges', user_id=user.id)
+
+İşler `Job` tablosunda tutulur ve `python manage.py runworker` ile çalıştırılır.
+SQLite'ta SELECT ... FOR UPDATE SKIP LOCKED olmadığından worker'lar işi
+iyimser bir UPDATE ile sahiplenir: aynı işi yalnızca satırı gerçekten
+güncelleyebilen (rowcount = 1) worker alır. Görünürlük süresinde bitmeyen işler
+(worker çöktüyse) tekrar alınır; hata veren işler üstel beklemeyle yeniden
+denenir, deneme hakkı bitenler 'dead' durumunda kalır (yönetim panelinden
+tekrar sıraya alınabilir). Başarılı işler silinir.
+
+JOBS_INLINE=True iken işler kuyruğa yazılmadan hemen çalıştırılır. Parametreler
+her iki modda da JSON'a çevrilip geri okunur; böylece JSON'a çevrilemeyen
+parametreler (model örneği, tarih, küme) geliştirmede de hata verir ve iş,
+worker'da alacağı değerlerle (ör. tuple yerine liste) çalışır.
+"""
+import datetime
+import json
+import logging
+import os
+import random
+import socket
+import time
+import traceback
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from . import metrics
+from .db import retry_on_locked
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+def job(name=None, priority=0, max_attempts=None, timeout=None):
+    """Fonksiyonu kuyruk işi olarak kaydeder; parametreler JSON'a çevrilebilir olmalıdır."""
+    def decorator(func):
+        func.job_name = name or func.__name__
+        func.job_options = {'priority': priority, 'max_attempts': max_attempts, 'timeout': timeout}
+        _registry[func.job_name] = func
+        return func
+    return decorator
+
+
+def enqueue(name, delay=0, priority=None, **payload):
+    """İşi kuyruğa ekler (çağıran transaction'la birlikte commit edilir)."""
+    func = _registry[getattr(name, 'job_name', name)]
+    payload = json.loads(json.dumps(payload))
+    if settings.JOBS_INLINE:
+        func(**payload)
+        return None
+
+    options = func.job_options
+    return Job.objects.create(
+        name=func.job_name,
+        payload=payload,
+        priority=options['priority'] if priority is None else priority,
+        max_attempts=options['max_attempts'] or settings.JOB_MAX_ATTEMPTS,
+        timeout=options['timeout'] or settings.JOB_VISIBILITY_TIMEOUT,
+        run_at=timezone.now() + datetime.timedelta(seconds=delay),
+    )
+
+
+# Worker
+def _available(now):
+    # Sıradaki işler ya da görünürlük süresi dolmuş (worker'ı çökmüş) işler
+    return Q(status='queued', run_at__lte=now) | Q(status='running', locked_until__lt=now)
+
+
+def claim(worker_id, batch=10):
+    """Sıradaki işi sahiplenir; iş yoksa None döner."""
+    now = timezone.now()
+    candidates = Job.objects.filter(_available(now)).values_list('id', 'timeout')[:batch]
+    for job_id, timeout in candidates:
+        claimed = retry_on_locked(
+            lambda: Job.objects.filter(_available(now), id=job_id).update(
+                status='running',
+                locked_by=worker_id,
+                locked_until=now + datetime.timedelta(seconds=timeout),
+                attempts=F('attempts') + 1,
+            )
+        )()
+        if claimed:
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def _owned(job_obj):
+    # İş görünürlük süresini aşıp başka worker'a geçtiyse sonucu yazılmaz
+    return Job.objects.filter(id=job_obj.id, status='running', locked_by=job_obj.locked_by)
+
+
+def _retry_delay(attempts):
+    delay = min(settings.JOB_RETRY_BASE * 2 ** (attempts - 1), settings.JOB_RETRY_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _fail(job_obj, error):
+    if job_obj.attempts >= job_obj.max_attempts:
+        changes = {'status': 'dead', 'locked_until': None, 'last_error': error}
+        result = 'dead'
+    else:
+        changes = {
+            'status': 'queued',
+            'locked_until': None,
+            'run_at': timezone.now() + datetime.timedelta(seconds=_retry_delay(job_obj.attempts)),
+            'last_error': error,
+        }
+        result = 'retry'
+    retry_on_locked(lambda: _owned(job_obj).update(**changes))()
+    return result
+
+
+def run(job_obj):
+    """Sahiplenilmiş işi çalıştırır; 'done', 'retry' ya da 'dead' döner."""
+    func = _registry.get(job_obj.name)
+    started = time.monotonic()
+    if func is None:
+        result = _fail(job_obj, f'Kayıtlı olmayan iş: {job_obj.name}')
+    elif job_obj.attempts > job_obj.max_attempts:
+        # Her denemede worker'ı çökerten iş sonsuza kadar tekrar alınmaz
+        result = _fail(job_obj, job_obj.last_error or 'Görünürlük süresi aşıldı')
+    else:
+        try:
+            func(**job_obj.payload)
+        except Exception:
+            logger.exception('İş başarısız: %s #%s', job_obj.name, job_obj.id)
+            result = _fail(job_obj, traceback.format_exc())
+        else:
+            retry_on_locked(lambda: _owned(job_obj).delete())()
+            result = 'done'
+
+    metrics.inc('kesfet_jobs_total', {'job': job_obj.name, 'result': result})
+    metrics.observe('kesfet_job_duration_seconds', time.monotonic() - started, {'job': job_obj.name})
+    return result
+
+
+def requeue(queryset):
+    """Başarısız (dead) işleri deneme hakları sıfırlanarak tekrar sıraya alır."""
+    return queryset.filter(status='dead').update(
+        status='queued', attempts=0, run_at=timezone.now(), locked_until=None, last_error='',
+    )
+
+
+def default_worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def work(worker_id=None, burst=False, poll_interval=None, should_stop=lambda: False):
+    """
+    İşleri sırayla çalıştırır. `burst`: kuyruk boşalınca döner.
+    Çalıştırılan iş sayısını döner.
+    """
+    worker_id = worker_id or default_worker_id()
+    poll_interval = settings.JOB_POLL_INTERVAL if poll_interval is None else poll_interval
+    processed = 0
+    while not should_stop():
+        job_obj = claim(worker_id)
+        if job_obj is None:
+            if burst:
+                break
+            time.sleep(poll_interval)
+            continue
+        run(job_obj)
+        processed += 1
+    return processed
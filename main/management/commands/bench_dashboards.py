@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import RequestFactory
+
+from main import dashboards, views
+from main.models import User
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0
+
+
+class Command(BaseCommand):
+    help = (
+        'Öğrenci ve öğretmen panolarının senkron (sorgular sırayla) ve async '
+        '(sorgular aynı anda) sürümlerini eşzamanlı istekler altında karşılaştırır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=8, help='Aynı anda gelen istek sayısı')
+        parser.add_argument('--duration', type=float, default=5.0, help='Her ölçüm için saniye')
+        parser.add_argument('--student', help='Öğrenci kullanıcı adı (varsayılan: ilk öğrenci)')
+        parser.add_argument('--teacher', help='Öğretmen kullanıcı adı (varsayılan: ilk öğretmen)')
+
+    def handle(self, *args, **options):
+        cases = [
+            ('öğrenci', self.get_user('student', options['student']),
+             views.student_dashboard, dashboards.student_dashboard),
+            ('öğretmen', self.get_user('teacher', options['teacher']),
+             views.teacher_dashboard, dashboards.teacher_dashboard),
+        ]
+        for label, user, sync_view, async_view in cases:
+            for mode, run in (('sync', self.run_sync), ('async', self.run_async)):
+                view = sync_view if mode == 'sync' else async_view
+                latencies = run(view, user, options['concurrency'], options['duration'])
+                self.stdout.write(
+                    f'{label:<9} {mode:<6} {len(latencies) / options["duration"]:>8.1f} istek/sn  '
+                    f'p50: {_percentile(latencies, 0.5) * 1000:>7.1f} ms  '
+                    f'p95: {_percentile(latencies, 0.95) * 1000:>7.1f} ms'
+                )
+
+    def get_user(self, role, username):
+        users = User.objects.filter(role=role, is_active=True)
+        user = users.filter(username=username).first() if username else users.order_by('id').first()
+        if user is None:
+            raise CommandError(f'Ölçüm için {role} kullanıcısı bulunamadı.')
+        return user
+
+    def make_request(self, user):
+        request = RequestFactory().get('/dashboard/')
+        request.user = user
+
+        async def auser():
+            return user
+        request.auser = auser
+        return request
+
+    def run_sync(self, view, user, concurrency, duration):
+        latencies = []
+        lock = threading.Lock()
+        deadline = time.monotonic() + duration
+
+        def worker():
+            mine = []
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                view(self.make_request(user))
+                mine.append(time.perf_counter() - start)
+            with lock:
+                latencies.extend(mine)
+            connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return latencies
+
+    def run_async(self, view, user, concurrency, duration):
+        latencies = []
+
+        async def worker(deadline):
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                await view(self.make_request(user))
+                latencies.append(time.perf_counter() - start)
+
+        async def main():
+            deadline = time.monotonic() + duration
+            await asyncio.gather(*(worker(deadline) for _ in range(concurrency)))
+
+        asyncio.run(main())
+        return latencies
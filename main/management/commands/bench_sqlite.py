@@ -0,0 +1,103 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+
+SCHEMA = """
+CREATE TABLE attempt (id INTEGER PRIMARY KEY, user_id INTEGER, score INTEGER, completed_at REAL);
+CREATE TABLE answer (id INTEGER PRIMARY KEY, attempt_id INTEGER, question_id INTEGER, is_correct INTEGER);
+CREATE TABLE user (id INTEGER PRIMARY KEY, total_points INTEGER);
+"""
+
+PRODUCTION_PRAGMAS = (
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA busy_timeout = 20000',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA cache_size = -64000',
+    'PRAGMA temp_store = MEMORY',
+)
+
+
+class Command(BaseCommand):
+    help = 'Varsayılan SQLite ayarları ile üretim profilini (WAL, BEGIN IMMEDIATE, pragmalar) eşzamanlı quiz gönderimlerinde karşılaştırır.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=5.0, help='Her profil için saniye')
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--questions', type=int, default=10)
+
+    def handle(self, *args, **options):
+        for profile in ('default', 'production'):
+            result = self.run_profile(profile, options)
+            self.stdout.write(
+                f"{profile:<11} {result['submissions'] / options['duration']:>8.1f} gönderim/sn  "
+                f"kilit hatası: {result['locked']:<5} "
+                f"p95: {result['p95'] * 1000:.1f} ms"
+            )
+
+    def run_profile(self, profile, options):
+        production = profile == 'production'
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bench.sqlite3')
+            setup = sqlite3.connect(path)
+            setup.executescript(SCHEMA)
+            setup.executemany('INSERT INTO user (id, total_points) VALUES (?, 0)', [(i,) for i in range(options['users'])])
+            setup.commit()
+            setup.close()
+
+            stats = {'submissions': 0, 'locked': 0, 'latencies': []}
+            stats_lock = threading.Lock()
+            deadline = time.monotonic() + options['duration']
+
+            def worker(worker_id):
+                # Django varsayılanı: 5 sn timeout, ertelenmiş (DEFERRED) transaction
+                conn = sqlite3.connect(path, timeout=20 if production else 5, isolation_level=None)
+                if production:
+                    for pragma in PRODUCTION_PRAGMAS:
+                        conn.execute(pragma)
+                begin = 'BEGIN IMMEDIATE' if production else 'BEGIN'
+                i = 0
+                while time.monotonic() < deadline:
+                    user_id = (worker_id * 7919 + i) % options['users']
+                    i += 1
+                    start = time.perf_counter()
+                    try:
+                        conn.execute(begin)
+                        # Okuma ardından yazma: ertelenmiş transaction'da kilit yükseltme çakışması
+                        conn.execute('SELECT total_points FROM user WHERE id = ?', (user_id,)).fetchone()
+                        cursor = conn.execute(
+                            'INSERT INTO attempt (user_id, score, completed_at) VALUES (?, ?, ?)',
+                            (user_id, 70, time.time()),
+                        )
+                        conn.executemany(
+                            'INSERT INTO answer (attempt_id, question_id, is_correct) VALUES (?, ?, 1)',
+                            [(cursor.lastrowid, q) for q in range(options['questions'])],
+                        )
+                        conn.execute('UPDATE user SET total_points = total_points + 50 WHERE id = ?', (user_id,))
+                        conn.execute('COMMIT')
+                    except sqlite3.OperationalError:
+                        if conn.in_transaction:
+                            conn.execute('ROLLBACK')
+                        with stats_lock:
+                            stats['locked'] += 1
+                        continue
+                    with stats_lock:
+                        stats['submissions'] += 1
+                        stats['latencies'].append(time.perf_counter() - start)
+                conn.close()
+
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(options['threads'])]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        latencies = sorted(stats['latencies']) or [0]
+        stats['p95'] = latencies[int(len(latencies) * 0.95) - 1 if len(latencies) > 1 else 0]
+        return stats
@@ -0,0 +1,36 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from main.images import build_all
+from main.models import Question
+
+
+class Command(BaseCommand):
+    help = 'Var olan soru görselleri için küçültülmüş/WebP varyantları işlem havuzunda üretir.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Paralel işlem sayısı')
+        parser.add_argument('--force', action='store_true', help='Güncel varyantları da yeniden üret')
+
+    def handle(self, *args, **options):
+        names = list(
+            Question.objects.exclude(image='').exclude(image__isnull=True)
+            .order_by().values_list('image', flat=True).distinct()
+        )
+        if not names:
+            self.stdout.write('Görselli soru yok.')
+            return
+
+        generated, errors = build_all(
+            names,
+            workers=options['workers'],
+            force=options['force'],
+            progress=lambda done, total: self.stdout.write(f'{done}/{total} görsel', ending='\r'),
+        )
+        self.stdout.write('')
+        for name, error in errors:
+            self.stderr.write(f'  {name}: {error}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(names)} görsel işlendi, {generated} varyant dosyası üretildi, {len(errors)} hata.'
+        ))
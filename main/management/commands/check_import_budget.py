@@ -0,0 +1,101 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+BUDGET_PATH = Path(__file__).resolve().parents[2] / 'import_budget.json'
+
+# Ayrı bir süreçte çalışır: ölçüme yalnızca açılışta yüklenenler girer
+PROBE = """
+import json, os, resource, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# Linux'ta KB, macOS'ta bayt
+rss_mb = rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+print(json.dumps({'seconds': elapsed, 'rss_mb': rss_mb, 'modules': sorted(sys.modules)}))
+"""
+
+
+def probe():
+    """Açılışı yeni bir süreçte bir kez ölçer: {'seconds', 'rss_mb', 'modules'}."""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings')}
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=BUDGET_PATH.parents[1], env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise CommandError(f'Ölçüm süreci başarısız:\n{result.stderr}')
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def load_budget():
+    return json.loads(BUDGET_PATH.read_text())
+
+
+def measure(runs=3):
+    """Ölçümlerin ortancası; modül listesi ilk ölçümden alınır."""
+    results = [probe() for _ in range(runs)]
+    return {
+        'seconds': statistics.median(run['seconds'] for run in results),
+        'rss_mb': statistics.median(run['rss_mb'] for run in results),
+        'modules': results[0]['modules'],
+    }
+
+
+def check(budget, measured):
+    """Bütçe aşımlarını açıklayan mesajların listesi (boşsa bütçe içinde)."""
+    # Tembel yüklenmesi gereken paketler açılışta yüklenmemeli
+    loaded = sorted({
+        name for name in measured['modules']
+        for forbidden in budget['forbidden_modules']
+        if name == forbidden or name.startswith(forbidden + '.')
+    })
+    problems = []
+    if measured['seconds'] > budget['seconds']:
+        problems.append(f'açılış süresi bütçeyi aşıyor ({measured["seconds"]:.3f} > {budget["seconds"]} sn)')
+    if measured['rss_mb'] > budget['rss_mb']:
+        problems.append(f'bellek bütçeyi aşıyor ({measured["rss_mb"]:.1f} > {budget["rss_mb"]} MB)')
+    if loaded:
+        problems.append(f'açılışta yüklenmemesi gereken modüller: {", ".join(loaded[:10])}')
+    return problems
+
+
+class Command(BaseCommand):
+    help = (
+        'django.setup() ve URLconf yükleme süresini/belleğini ayrı süreçte ölçer; '
+        f'{BUDGET_PATH.name} içindeki bütçe aşılırsa hata verir (CI için; aynı kontrol main/tests.py içinde de var).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Ölçüm sayısı (ortanca alınır)')
+        parser.add_argument('--update', action='store_true', help='Bütçeyi ölçülen değerler + pay ile yeniden yaz')
+        parser.add_argument('--headroom', type=float, default=1.3, help='--update için çarpan')
+
+    def handle(self, *args, **options):
+        budget = load_budget()
+        measured = measure(options['runs'])
+
+        self.stdout.write(f'Süre: {measured["seconds"]:.3f} sn (bütçe {budget["seconds"]} sn)')
+        self.stdout.write(f'Bellek: {measured["rss_mb"]:.1f} MB (bütçe {budget["rss_mb"]} MB)')
+        self.stdout.write(f'Yüklenen modül: {len(measured["modules"])}')
+
+        if options['update']:
+            budget['seconds'] = round(measured['seconds'] * options['headroom'], 2)
+            budget['rss_mb'] = round(measured['rss_mb'] * options['headroom'])
+            BUDGET_PATH.write_text(json.dumps(budget, indent=2, ensure_ascii=False) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Bütçe güncellendi: {BUDGET_PATH}'))
+            return
+
+        problems = check(budget, measured)
+        if problems:
+            raise CommandError('; '.join(problems))
+        self.stdout.write(self.style.SUCCESS('Açılış bütçesi içinde.'))
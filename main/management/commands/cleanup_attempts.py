@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from main.retention import delete_abandoned_attempts
+
+
+class Command(BaseCommand):
+    help = 'Uzun süredir bitirilmemiş quiz denemelerini ve cevaplarını parça parça siler.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=settings.ABANDONED_ATTEMPT_HOURS,
+                            help='Bu saatten uzun süredir açık denemeler silinir')
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--pause', type=float, default=0.05, help='Parçalar arası bekleme (saniye)')
+        parser.add_argument('--dry-run', action='store_true', help='Silmeden yalnızca raporla')
+
+    def handle(self, *args, **options):
+        removed = delete_abandoned_attempts(
+            hours=options['hours'],
+            chunk_size=options['chunk_size'],
+            pause=options['pause'],
+            dry_run=options['dry_run'],
+            progress=lambda n: self.stdout.write(f'{n} deneme silindi', ending='\r'),
+        )
+        if not removed:
+            self.stdout.write('Terk edilmiş deneme yok.')
+            return
+        if not options['dry_run']:
+            self.stdout.write('')
+        for title, count in removed.most_common():
+            self.stdout.write(f'  {title}: {count}')
+        verb = 'silinecek' if options['dry_run'] else 'silindi'
+        self.stdout.write(self.style.SUCCESS(f'Toplam {sum(removed.values())} deneme {verb}.'))
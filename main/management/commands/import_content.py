@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main.importer import detect_format, import_file
+from main.models import User
+
+
+class Command(BaseCommand):
+    help = 'Kategori, quiz, soru, cevap ve bilgi kartlarını JSON Lines ya da CSV dosyasından içe aktarır.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['jsonl', 'csv'], default=None,
+                            help='Varsayılan: dosya uzantısından (.csv ise csv, değilse jsonl)')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--owner', help='Yeni quiz\'lerin sahibi olacak öğretmenin kullanıcı adı')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+        owner = None
+        if options['owner']:
+            owner = User.objects.filter(username=options['owner']).first()
+            if owner is None:
+                raise CommandError(f'Kullanıcı bulunamadı: {options["owner"]}')
+        try:
+            with open(path, encoding='utf-8-sig', newline='') as stream:
+                report = import_file(
+                    stream, fmt,
+                    batch_size=options['batch_size'],
+                    created_by=owner,
+                    progress=lambda r: self.stdout.write(f'{r.rows} satır işlendi', ending='\r'),
+                )
+        except OSError as e:
+            raise CommandError(e)
+
+        self.stdout.write('')
+        for line_no, message in report.errors:
+            self.stderr.write(f'  satır {line_no}: {message}')
+        style = self.style.WARNING if report.errors else self.style.SUCCESS
+        self.stdout.write(style(report.summary()))
@@ -0,0 +1,54 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+
+from main.routers import LOG_MODELS
+
+
+class Command(BaseCommand):
+    help = 'Log tablolarındaki eski kayıtları varsayılan veritabanından log veritabanına taşır.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        source = connections['default']
+        target = connections[settings.LOGS_DATABASE]
+        chunk_size = options['chunk_size']
+
+        for model_name in sorted(LOG_MODELS):
+            model = apps.get_model('main', model_name)
+            table = model._meta.db_table
+            if table not in source.introspection.table_names():
+                continue
+
+            columns = [field.column for field in model._meta.concrete_fields]
+            column_sql = ', '.join(source.ops.quote_name(c) for c in columns)
+            placeholders = ', '.join(['%s'] * len(columns))
+            moved = 0
+            last_id = 0
+
+            while True:
+                with source.cursor() as cursor:
+                    cursor.execute(
+                        f'SELECT {column_sql} FROM {table} WHERE id > %s ORDER BY id LIMIT %s',
+                        [last_id, chunk_size],
+                    )
+                    rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                # Aynı id'ler korunur; komut tekrar çalıştırılırsa kayıtlar çiftlenmez
+                with transaction.atomic(using=target.alias), target.cursor() as cursor:
+                    cursor.executemany(
+                        f'INSERT OR IGNORE INTO {table} ({column_sql}) VALUES ({placeholders})',
+                        rows,
+                    )
+                first_id = rows[0][columns.index('id')]
+                last_id = rows[-1][columns.index('id')]
+                with transaction.atomic(using='default'), source.cursor() as cursor:
+                    cursor.execute(f'DELETE FROM {table} WHERE id BETWEEN %s AND %s', [first_id, last_id])
+                moved += len(rows)
+
+            self.stdout.write(f'{table}: {moved} kayıt taşındı')
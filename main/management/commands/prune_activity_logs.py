@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from main.retention import prune_activity_logs
+
+
+class Command(BaseCommand):
+    help = 'Eski ActivityLog kayıtlarını günlük özetlere toplar, arşivler ve parça parça siler.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ACTIVITY_LOG_RETENTION_DAYS,
+                            help='Bu günden eski ham kayıtlar işlenir')
+        parser.add_argument('--archive-dir', default=str(settings.ACTIVITY_LOG_ARCHIVE_DIR))
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--pause', type=float, default=0.05, help='Parçalar arası bekleme (saniye)')
+
+    def handle(self, *args, **options):
+        processed, archive_path = prune_activity_logs(
+            days=options['days'],
+            archive_dir=options['archive_dir'],
+            chunk_size=options['chunk_size'],
+            pause=options['pause'],
+            progress=lambda n: self.stdout.write(f'{n} kayıt işlendi', ending='\r'),
+        )
+        if not processed:
+            self.stdout.write('İşlenecek eski kayıt yok.')
+            return
+        self.stdout.write(self.style.SUCCESS(f'{processed} kayıt özetlendi ve arşivlendi: {archive_path}'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from main.accounts import purge_deleted_accounts
+
+
+class Command(BaseCommand):
+    help = 'Silinmesi talep edilen hesapların verilerini parça parça siler.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--pause', type=float, default=0.05, help='Parçalar arası bekleme (saniye)')
+
+    def handle(self, *args, **options):
+        results = purge_deleted_accounts(chunk_size=options['chunk_size'], pause=options['pause'])
+        if not results:
+            self.stdout.write('Silinecek hesap yok.')
+            return
+        for username, counts in results:
+            summary = ', '.join(f'{name}: {count}' for name, count in counts.items()) or 'veri yok'
+            self.stdout.write(f'  {username} — {summary}')
+        self.stdout.write(self.style.SUCCESS(f'{len(results)} hesap temizlendi.'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from main import search
+
+
+class Command(BaseCommand):
+    help = 'Quiz, soru ve bilgi kartı arama indeksini (FTS5) sıfırdan kurar.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        total = search.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{total} kayıt indekslendi.'))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from main.points import reconcile
+
+
+class Command(BaseCommand):
+    help = 'Kullanıcıların toplam puanını ve seviyesini puan defterinden yeniden hesaplar.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        fixed = reconcile(
+            chunk_size=options['chunk_size'],
+            progress=lambda last_id, fixed: self.stdout.write(f'id {last_id} kadar işlendi ({fixed} düzeltme)', ending='\r'),
+        )
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'{fixed} kullanıcının puanı veya seviyesi düzeltildi.'))
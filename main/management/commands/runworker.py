@@ -0,0 +1,35 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from main import jobs
+
+
+class Command(BaseCommand):
+    help = 'Arka plan iş kuyruğunu çalıştırır. Birden fazla worker için komutu birden çok kez başlatın.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--burst', action='store_true', help='Kuyruk boşalınca çık')
+        parser.add_argument('--sleep', type=float, default=None, help='Kuyruk boşken bekleme (saniye)')
+        parser.add_argument('--worker-id', default=None)
+
+    def handle(self, *args, **options):
+        stopping = []
+
+        # SIGTERM/SIGINT: çalışan iş bitirilir, sonra çıkılır
+        def stop(signum, frame):
+            self.stdout.write('Durduruluyor, çalışan iş bekleniyor...')
+            stopping.append(signum)
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        worker_id = options['worker_id'] or jobs.default_worker_id()
+        self.stdout.write(f'Worker başladı: {worker_id}')
+        processed = jobs.work(
+            worker_id=worker_id,
+            burst=options['burst'],
+            poll_interval=options['sleep'],
+            should_stop=lambda: bool(stopping),
+        )
+        self.stdout.write(self.style.SUCCESS(f'{processed} iş çalıştırıldı.'))
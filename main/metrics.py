@@ -0,0 +1,261 @@
+"""
+Prometheus metin formatında uygulama metrikleri.
+
+Her worker süreci metriklerini bellekte tutar ve METRICS_FLUSH_INTERVAL
+saniyede bir METRICS_DIR altındaki kendi dosyasına (<pid>.json) yazar.
+/metrics isteği hangi worker'a düşerse düşsün dizindeki tüm dosyaları
+birleştirir; böylece sayaçlar ve histogramlar tüm süreçler için toplanır.
+Artık çalışmayan süreçlerin dosyaları silinmeden önce değerleri kalıcı
+`archived.json` dosyasına eklenir (prometheus_client multiprocess modu gibi);
+böylece worker yeniden başlatılınca toplamlar düşmez ve rate() sahte sıçrama
+göstermez. Aynı PID'i alan yeni süreç de ilk yazımdan önce eski dosyayı arşivler.
+METRICS_DIR boşsa yalnızca mevcut sürecin metrikleri döner.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.files import locks
+
+# Saniye cinsinden varsayılan histogram aralıkları
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metrik tanımları: ad -> (tip, açıklama)
+METRICS = {
+    'kesfet_http_request_duration_seconds': ('histogram', 'HTTP istek süresi (URL adı, metot ve durum koduna göre)'),
+    'kesfet_db_queries_total': ('counter', 'Çalıştırılan veritabanı sorgusu sayısı'),
+    'kesfet_db_query_duration_seconds_total': ('counter', 'Veritabanı sorgularında geçen toplam süre'),
+    'kesfet_gemini_request_duration_seconds': ('histogram', 'Gemini API çağrı süresi'),
+    'kesfet_gemini_errors_total': ('counter', 'Hata ile biten Gemini API çağrıları'),
+    'kesfet_gemini_tokens_total': ('counter', 'Gemini API token kullanımı'),
+    'kesfet_cache_requests_total': ('counter', 'Önbellek okumaları (hit/miss)'),
+    'kesfet_quiz_submissions_total': ('counter', 'Gönderilen quiz sayısı (dakikalık oran için rate() kullanın)'),
+    'kesfet_throttle_blocks_total': ('counter', 'İstek sınırı aşıldığı için engellenen istemciler'),
+    'kesfet_jobs_total': ('counter', 'Çalıştırılan arka plan işleri (done/retry/dead)'),
+    'kesfet_job_duration_seconds': ('histogram', 'Arka plan işi süresi'),
+    'kesfet_warmup_duration_seconds': ('histogram', 'Worker ısınma süresi (main/warmup.py)'),
+}
+
+_lock = threading.Lock()
+_counters = {}    # (ad, etiketler) -> değer
+_histograms = {}  # (ad, etiketler) -> [bucket sayaçları..., toplam, adet]
+_last_flush = 0.0
+_flushed_pid = None
+
+ARCHIVE_NAME = 'archived.json'
+
+
+def _key(name, labels):
+    return (name, tuple(sorted((labels or {}).items())))
+
+
+def inc(name, labels=None, value=1):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+    _maybe_flush()
+
+
+def observe(name, value, labels=None, buckets=DEFAULT_BUCKETS):
+    key = _key(name, labels)
+    with _lock:
+        data = _histograms.get(key)
+        if data is None:
+            data = _histograms[key] = [0] * (len(buckets) + 2)
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                data[i] += 1
+        data[-2] += value
+        data[-1] += 1
+    _maybe_flush()
+
+
+def record_cache_lookup(cache_name, hit):
+    inc('kesfet_cache_requests_total', {'cache': cache_name, 'result': 'hit' if hit else 'miss'})
+
+
+def record_quiz_submission(passed):
+    inc('kesfet_quiz_submissions_total', {'result': 'passed' if passed else 'failed'})
+
+
+# Süreç dosyaları
+def _metrics_dir():
+    return getattr(settings, 'METRICS_DIR', '') or ''
+
+
+def _snapshot():
+    with _lock:
+        return {
+            'counters': [[name, list(labels), value] for (name, labels), value in _counters.items()],
+            'histograms': [[name, list(labels), list(data)] for (name, labels), data in _histograms.items()],
+        }
+
+
+def _read(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path, snapshot):
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f)
+    # Atomik değiştirme: okuyucular yarım yazılmış dosya görmez
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def _archive_lock(directory):
+    # Arşivleme ve okuma tek kilit altında: dosya arşive eklenip silinirken
+    # başka bir /metrics isteği değerleri iki kez ya da hiç saymaz
+    with open(os.path.join(directory, 'archive.lock'), 'a') as lock_file:
+        locks.lock(lock_file, locks.LOCK_EX)
+        try:
+            yield
+        finally:
+            locks.unlock(lock_file)
+
+
+def _archive(directory, paths):
+    """Süreç dosyalarının değerlerini archived.json'a ekler ve dosyaları siler (kilit altında çağrılır)."""
+    archived = {path: _read(path) for path in paths if os.path.exists(path)}
+    if not archived:
+        return
+    archive_path = os.path.join(directory, ARCHIVE_NAME)
+    _write(archive_path, _to_snapshot(*_merge([_read(archive_path), *archived.values()])))
+    for path in archived:
+        os.remove(path)
+
+
+def flush():
+    global _last_flush, _flushed_pid
+    directory = _metrics_dir()
+    _last_flush = time.monotonic()
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'{os.getpid()}.json')
+    if _flushed_pid != os.getpid():
+        # Dosya varsa aynı PID'i kullanmış ölü bir sürece aittir
+        if os.path.exists(path):
+            with _archive_lock(directory):
+                _archive(directory, [path])
+        _flushed_pid = os.getpid()
+    _write(path, _snapshot())
+
+
+def _maybe_flush():
+    interval = getattr(settings, 'METRICS_FLUSH_INTERVAL', 5)
+    if _metrics_dir() and time.monotonic() - _last_flush >= interval:
+        flush()
+
+
+def _after_fork():
+    global _lock
+    # Çocuk süreç ana sürecin değerlerini tekrar saymaz
+    _lock = threading.Lock()
+    _counters.clear()
+    _histograms.clear()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def _is_running(pid):
+    if os.name != 'posix':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _merge(snapshots):
+    counters = {}
+    histograms = {}
+    for snapshot in snapshots:
+        if not snapshot:
+            continue
+        for name, labels, value in snapshot['counters']:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, data in snapshot['histograms']:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            merged = histograms.setdefault(key, [0] * len(data))
+            for i, value in enumerate(data):
+                merged[i] += value
+    return counters, histograms
+
+
+def _to_snapshot(counters, histograms):
+    return {
+        'counters': [[name, [list(pair) for pair in labels], value] for (name, labels), value in counters.items()],
+        'histograms': [[name, [list(pair) for pair in labels], data] for (name, labels), data in histograms.items()],
+    }
+
+
+def _collect():
+    """Tüm süreçlerin (ve arşivlenmiş ölü süreçlerin) metriklerini birleştirir."""
+    directory = _metrics_dir()
+    if not directory:
+        return _merge([_snapshot()])
+
+    flush()
+    with _archive_lock(directory):
+        dead = [
+            os.path.join(directory, filename)
+            for filename in os.listdir(directory)
+            if filename.endswith('.json') and filename[:-5].isdigit() and not _is_running(int(filename[:-5]))
+        ]
+        _archive(directory, dead)
+        paths = [os.path.join(directory, filename) for filename in os.listdir(directory) if filename.endswith('.json')]
+        return _merge([_read(path) for path in paths])
+
+
+def _format_labels(labels, extra=None):
+    pairs = list(labels) + list(extra or [])
+    if not pairs:
+        return ''
+    escaped = (
+        '{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in pairs
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_number(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render():
+    """Metrikleri Prometheus metin formatında (0.0.4) döner."""
+    counters, histograms = _collect()
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'counter':
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f'{name}{_format_labels(labels)} {_format_number(value)}')
+        else:
+            for (metric, labels), data in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(DEFAULT_BUCKETS, data):
+                    lines.append(f'{name}_bucket{_format_labels(labels, [("le", bound)])} {count}')
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {data[-1]}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_number(data[-2])}')
+                lines.append(f'{name}_count{_format_labels(labels)} {data[-1]}')
+    return '\n'.join(lines) + '\n'
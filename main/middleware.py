@@ -0,0 +1,53 @@
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+from . import metrics
+
+
+# Veritabanı metrikleri
+@contextmanager
+def record_db_queries():
+    """Bu bağlamdaki (thread/context) bağlantılarda çalışan sorguları metriklere ekler."""
+    query_stats = {}
+
+    def record_query(execute, sql, params, many, context):
+        alias = context['connection'].alias
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            count, elapsed = query_stats.get(alias, (0, 0.0))
+            query_stats[alias] = (count + 1, elapsed + time.perf_counter() - start)
+
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record_query))
+            yield
+    finally:
+        for alias, (count, query_time) in query_stats.items():
+            metrics.inc('kesfet_db_queries_total', {'alias': alias}, count)
+            metrics.inc('kesfet_db_query_duration_seconds_total', {'alias': alias}, query_time)
+
+
+# İstek metrikleri
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with record_db_queries():
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match and match.view_name else 'unmatched'
+        metrics.observe('kesfet_http_request_duration_seconds', elapsed, {
+            'view': view,
+            'method': request.method,
+            'status': str(response.status_code),
+        })
+        return response
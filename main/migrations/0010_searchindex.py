@@ -0,0 +1,46 @@
+from django.db import migrations
+
+
+def _fold(column):
+    # main/search.py normalize() ile aynı: noktasız ı ve İ -> i
+    return f"replace(replace({column}, 'ı', 'i'), 'İ', 'i')"
+
+
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE main_searchindex USING fts5(
+        kind UNINDEXED,
+        object_id UNINDEXED,
+        display_title UNINDEXED,
+        title,
+        body,
+        tokenize = "unicode61 remove_diacritics 2"
+    )
+    """,
+    f"""
+    INSERT INTO main_searchindex (kind, object_id, display_title, title, body)
+    SELECT 'quiz', id, title, {_fold('title')}, {_fold('description')}
+    FROM main_quiz WHERE is_published
+    """,
+    f"""
+    INSERT INTO main_searchindex (kind, object_id, display_title, title, body)
+    SELECT 'question', q.id, z.title, {_fold('z.title')}, {_fold('q.question_text')}
+    FROM main_question q JOIN main_quiz z ON z.id = q.quiz_id WHERE z.is_published
+    """,
+    f"""
+    INSERT INTO main_searchindex (kind, object_id, display_title, title, body)
+    SELECT 'card', id, title, {_fold('title')}, {_fold('content')}
+    FROM main_knowledgecard WHERE is_active
+    """,
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_activityrollup'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, reverse_sql='DROP TABLE main_searchindex'),
+    ]
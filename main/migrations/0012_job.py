@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:45
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_user_deletion_requested_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('payload', models.JSONField(default=dict)),
+                ('priority', models.IntegerField(default=0, help_text='Büyük olan önce çalışır')),
+                ('status', models.CharField(choices=[('queued', 'Sırada'), ('running', 'Çalışıyor'), ('dead', 'Başarısız')], default='queued', max_length=10)),
+                ('attempts', models.IntegerField(default=0)),
+                ('max_attempts', models.IntegerField(default=5)),
+                ('timeout', models.IntegerField(default=300, help_text='Görünürlük süresi (saniye)')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-priority', 'run_at', 'id'],
+                'indexes': [models.Index(fields=['status', 'run_at'], name='main_job_status_b95b64_idx')],
+            },
+        ),
+    ]
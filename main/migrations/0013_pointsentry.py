@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:47
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Mevcut bakiyeler açılış kaydı olarak deftere yazılır; mutabakat bakiyeleri sıfırlamaz
+def create_opening_balances(apps, schema_editor):
+    User = apps.get_model('main', 'User')
+    PointsEntry = apps.get_model('main', 'PointsEntry')
+    users = User.objects.exclude(total_points=0).values_list('id', 'total_points')
+    PointsEntry.objects.bulk_create(
+        (PointsEntry(user_id=user_id, amount=points, reason='opening_balance') for user_id, points in users.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PointsEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.IntegerField()),
+                ('reason', models.CharField(choices=[('opening_balance', 'Açılış bakiyesi'), ('quiz_passed', 'Quiz başarısı'), ('card_read', 'Bilgi kartı'), ('adjustment', 'Düzeltme')], max_length=20)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='points_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', 'created_at'], name='main_points_user_id_4ab849_idx')],
+            },
+        ),
+        migrations.RunPython(create_opening_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_pointsentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['created_at'], name='main_activi_created_d92def_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quizattempt',
+            index=models.Index(fields=['completed_at'], name='main_quizat_complet_f0fb49_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='useranswer',
+            index=models.Index(fields=['answered_at'], name='main_useran_answere_3df55a_idx'),
+        ),
+    ]
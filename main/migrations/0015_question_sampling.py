@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_admin_browse_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='questions_per_attempt',
+            field=models.PositiveIntegerField(blank=True, help_text='Her denemede soru bankasından rastgele seçilecek soru sayısı (boşsa tüm sorular)', null=True),
+        ),
+        migrations.AddField(
+            model_name='quizattempt',
+            name='question_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:13
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_question_sampling'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThrottleCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=32, unique=True)),
+                ('count', models.IntegerField(default=0)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ThrottleBlock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=20)),
+                ('kind', models.CharField(max_length=20)),
+                ('ident', models.CharField(max_length=255)),
+                ('until', models.DateTimeField(db_index=True)),
+                ('strikes', models.IntegerField(default=1)),
+                ('blocked_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'unique_together': {('scope', 'kind', 'ident')},
+            },
+        ),
+    ]
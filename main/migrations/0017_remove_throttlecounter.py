@@ -0,0 +1,16 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:22
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0016_throttle_tables'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='ThrottleCounter',
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 
 # Özelleştirilmiş User Modeli
 class User(AbstractUser):
@@ -14,6 +15,8 @@ class User(AbstractUser):
     total_points = models.IntegerField(default=0)
     level = models.IntegerField(default=1)
     dark_mode = models.BooleanField(default=False)
+    # Hesap silme talebi: hesap hemen pasifleşir, veriler purge_deleted_accounts ile silinir
+    deletion_requested_at = models.DateTimeField(null=True, blank=True)
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
 
@@ -61,6 +64,10 @@ class Quiz(models.Model):
     passing_score = models.IntegerField(default=70, help_text='Geçme puanı yüzde olarak')
     time_limit = models.IntegerField(null=True, blank=True, help_text='dakika cinsinden')
     points_reward = models.IntegerField(default=50, help_text='Başarılı olunca kazanılan puan')
+    questions_per_attempt = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text='Her denemede soru bankasından rastgele seçilecek soru sayısı (boşsa tüm sorular)'
+    )
     is_published = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, limit_choices_to={'role': 'teacher'})
@@ -73,6 +80,12 @@ class Quiz(models.Model):
     
     def total_questions(self):
         return self.questions.count()
+    
+    def attempt_question_count(self):
+        total = self.questions.count()
+        if self.questions_per_attempt:
+            return min(total, self.questions_per_attempt)
+        return total
 
 
 # Soru
@@ -150,12 +163,21 @@ class QuizAttempt(models.Model):
     time_spent = models.IntegerField(null=True, blank=True, help_text='saniye cinsinden')
     started_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    # Bu denemede sorulan soruların id'leri (soru bankasından seçildiyse); boşsa tüm sorular
+    question_ids = models.JSONField(default=list, blank=True)
     
     class Meta:
         ordering = ['-started_at']
+        indexes = [models.Index(fields=['completed_at'])]
     
     def __str__(self):
         return f"{self.user.username} - {self.quiz.title} (%{self.percentage:.1f})"
+    
+    def get_questions(self):
+        questions = self.quiz.questions.all()
+        if self.question_ids:
+            questions = questions.filter(id__in=self.question_ids)
+        return questions
 
 
 # Kullanıcı Cevapları
@@ -168,24 +190,45 @@ class UserAnswer(models.Model):
     
     class Meta:
         unique_together = ('attempt', 'question')
+        indexes = [models.Index(fields=['answered_at'])]
     
     def __str__(self):
         return f"{self.attempt.user.username} - Q{self.question.order}"
 
 
 # Aktivite Logu (İlerleme takibi için)
+# Log modelleri ayrı veritabanında (main/routers.py); kullanıcı FK'si veritabanı kısıtı
+# olmadan tutulur ve kullanıcı silinince kayıtlar main/signals.py içinde temizlenir.
 class ActivityLog(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activities')
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='activities')
     activity_type = models.CharField(max_length=50)  # 'quiz_completed', 'badge_earned', 'level_up'
     description = models.TextField()
     points_earned = models.IntegerField(default=0)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Tamponlu yazımda olay zamanı korunur (main/activity.py)
+    created_at = models.DateTimeField(default=timezone.now)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['created_at'])]
     
     def __str__(self):
         return f"{self.user.username} - {self.activity_type}"
+
+
+# Günlük Aktivite Özeti (eski ActivityLog kayıtları buraya toplanır, bkz. prune_activity_logs)
+class ActivityRollup(models.Model):
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='activity_rollups')
+    date = models.DateField()
+    activity_type = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+    points_earned = models.IntegerField(default=0)
+    
+    class Meta:
+        unique_together = ('user', 'date', 'activity_type')
+        ordering = ['-date']
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.date} - {self.activity_type} ({self.count})"
   
     # İletişim Mesajları
 class ContactMessage(models.Model):
@@ -257,7 +300,7 @@ class DailyCardLimit(models.Model):
     
     # AI Chatbot Mesajları
 class ChatMessage(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='chat_messages')
+    user = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='chat_messages')
     message = models.TextField()
     response = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
@@ -266,4 +309,71 @@ class ChatMessage(models.Model):
         ordering = ['-created_at']
     
     def __str__(self):
-        return f"{self.user.username} - {self.created_at}"
\ No newline at end of file
+        return f"{self.user.username} - {self.created_at}"
+
+
+# Puan Hareketi (yalnızca eklenir; User.total_points bu kayıtların toplamıdır, bkz. main/points.py)
+class PointsEntry(models.Model):
+    REASON_CHOICES = (
+        ('opening_balance', 'Açılış bakiyesi'),
+        ('quiz_passed', 'Quiz başarısı'),
+        ('card_read', 'Bilgi kartı'),
+        ('adjustment', 'Düzeltme'),
+    )
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='points_entries')
+    amount = models.IntegerField()
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES)
+    description = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['user', 'created_at'])]
+    
+    def __str__(self):
+        return f"{self.user_id} {self.amount:+d} ({self.reason})"
+
+# Arka Plan İşi (main/jobs.py)
+class Job(models.Model):
+    STATUS_CHOICES = (
+        ('queued', 'Sırada'),
+        ('running', 'Çalışıyor'),
+        ('dead', 'Başarısız'),
+    )
+    
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    priority = models.IntegerField(default=0, help_text='Büyük olan önce çalışır')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=5)
+    timeout = models.IntegerField(default=300, help_text='Görünürlük süresi (saniye)')
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-priority', 'run_at', 'id']
+        indexes = [models.Index(fields=['status', 'run_at'])]
+    
+    def __str__(self):
+        return f"{self.name} #{self.id} ({self.get_status_display()})"
+
+
+# İstek Sınırı Engeli (main/throttle.py)
+class ThrottleBlock(models.Model):
+    scope = models.CharField(max_length=20)
+    kind = models.CharField(max_length=20)
+    ident = models.CharField(max_length=255)
+    until = models.DateTimeField(db_index=True)
+    strikes = models.IntegerField(default=1)
+    blocked_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        unique_together = ('scope', 'kind', 'ident')
+    
+    def __str__(self):
+        return f"{self.scope}/{self.kind}/{self.ident} ({self.until})"
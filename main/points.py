@@ -0,0 +1,126 @@
+"""
+Puan defteri: her puan değişikliği `PointsEntry` olarak eklenir ve bakiye
+tek bir atomik UPDATE ile (F ifadesi) artırılır; eşzamanlı kazanımlar
+kaybolmaz. Seviye, puan eşikleri tablosundan aynı UPDATE içinde hesaplanır.
+
+`reconcile_points` komutu bakiyeleri ve seviyeleri defterden yeniden kurar.
+"""
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+from .activity import log_activity
+from .cache import bump_version, invalidate_user, user_pages_version
+from .models import User, PointsEntry
+
+# (seviye, gereken toplam puan); artan sırada
+LEVEL_THRESHOLDS = (
+    (1, 0),
+    (2, 100),
+    (3, 250),
+    (4, 500),
+    (5, 1000),
+    (6, 2000),
+    (7, 3500),
+    (8, 5000),
+    (9, 7500),
+    (10, 10000),
+)
+
+
+def level_for(points):
+    current = 1
+    for level, threshold in LEVEL_THRESHOLDS:
+        if points >= threshold:
+            current = level
+    return current
+
+
+def level_case(offset=0):
+    """
+    `total_points + offset` için seviyeyi veren SQL ifadesi. UPDATE içinde
+    SET ifadeleri eski satır değerleriyle hesaplandığından artış `offset` ile verilir.
+    """
+    return Case(
+        *(
+            When(Q(total_points__gte=threshold - offset), then=Value(level))
+            for level, threshold in reversed(LEVEL_THRESHOLDS[1:])
+        ),
+        default=Value(1),
+        output_field=IntegerField(),
+    )
+
+
+def _changed(user):
+    # update() sinyal göndermez: önbellekler elle temizlenir
+    invalidate_user(user.pk)
+    bump_version(user_pages_version(user.pk))
+    if user.role == 'student':
+        bump_version('leaderboard')
+
+
+def award(user, amount, reason, description=''):
+    """
+    Deftere kayıt ekler ve bakiyeyi atomik olarak artırır; yeni seviyeyi döner.
+    `user` nesnesindeki total_points ve level güncellenir.
+    """
+    with transaction.atomic():
+        PointsEntry.objects.create(user=user, amount=amount, reason=reason, description=description)
+        User.objects.filter(pk=user.pk).update(
+            total_points=F('total_points') + amount,
+            level=level_case(offset=amount),
+        )
+        user.refresh_from_db(fields=['total_points', 'level'])
+        
+        if user.level > level_for(user.total_points - amount):
+            log_activity(
+                user=user,
+                activity_type='level_up',
+                description=f'Seviye {user.level} oldu',
+                points_earned=0
+            )
+    transaction.on_commit(lambda: _changed(user))
+    return user.level
+
+
+# Mutabakat
+def _ledger_total():
+    return Coalesce(
+        Subquery(
+            PointsEntry.objects.filter(user=OuterRef('pk'))
+            .values('user')
+            .annotate(total=Sum('amount'))
+            .values('total')
+        ),
+        Value(0),
+    )
+
+
+def reconcile(chunk_size=1000, progress=None):
+    """
+    Tüm kullanıcıların bakiye ve seviyesini defterden, id aralıkları halinde
+    küme tabanlı UPDATE'lerle yeniden hesaplar; düzeltilen kullanıcı sayısını döner.
+    """
+    fixed = 0
+    last_id = 0
+    while True:
+        ids = list(User.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:chunk_size])
+        if not ids:
+            break
+        last_id = ids[-1]
+        with transaction.atomic():
+            chunk = User.objects.filter(id__in=ids)
+            wrong = list(
+                chunk.annotate(ledger=_ledger_total())
+                .exclude(total_points=F('ledger'))
+                .values_list('id', flat=True)
+            )
+            chunk.update(total_points=_ledger_total())
+            wrong += chunk.exclude(level=level_case()).exclude(id__in=wrong).values_list('id', flat=True)
+            chunk.update(level=level_case())
+        for user in User.objects.filter(id__in=wrong).only('id', 'role'):
+            _changed(user)
+        fixed += len(wrong)
+        if progress:
+            progress(last_id, fixed)
+    return fixed
@@ -0,0 +1,138 @@
+"""
+ActivityLog saklama: eski ham kayıtları günlük özetlere toplar, sıkıştırılmış
+JSON Lines arşivine yazar ve küçük parçalar halinde siler. Terk edilmiş
+(bitirilmemiş) quiz denemeleri de burada temizlenir.
+
+Her parça kendi kısa transaction'ında işlenir (özet artırma + silme birlikte),
+böylece yazma kilidi uzun süre tutulmaz ve iş yarıda kesilirse tekrar
+çalıştırıldığında özetler çift sayılmaz. Arşiv dosyasına yazım transaction'dan
+önce yapılır; kesinti halinde aynı kayıt iki arşiv dosyasında görünebilir.
+"""
+import datetime
+import gzip
+import json
+import os
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from .db import retry_on_locked
+from .models import ActivityLog, ActivityRollup, QuizAttempt
+
+ARCHIVE_FIELDS = ('id', 'user_id', 'activity_type', 'description', 'points_earned', 'created_at')
+
+
+def retention_cutoff(days):
+    # Gün sınırına hizalanır: bir günün kayıtları ya tamamen özetlenir ya hiç
+    start_of_today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    return start_of_today - datetime.timedelta(days=days)
+
+
+def _rollup_rows(rows):
+    totals = defaultdict(lambda: [0, 0])
+    for row in rows:
+        key = (row['user_id'], timezone.localdate(row['created_at']), row['activity_type'])
+        totals[key][0] += 1
+        totals[key][1] += row['points_earned']
+    return totals
+
+
+def _apply_chunk(rows):
+    db = connections[settings.LOGS_DATABASE]
+    table = ActivityRollup._meta.db_table
+
+    @retry_on_locked(using=db.alias)
+    def apply():
+        params = [
+            (user_id, date, activity_type, count, points)
+            for (user_id, date, activity_type), (count, points) in _rollup_rows(rows).items()
+        ]
+        with db.cursor() as cursor:
+            # Mevcut özet varsa sayılar üzerine eklenir
+            cursor.executemany(
+                f'INSERT INTO {table} (user_id, date, activity_type, count, points_earned) '
+                'VALUES (%s, %s, %s, %s, %s) '
+                'ON CONFLICT (user_id, date, activity_type) DO UPDATE SET '
+                'count = count + excluded.count, points_earned = points_earned + excluded.points_earned',
+                params,
+            )
+        ActivityLog.objects.filter(id__in=[row['id'] for row in rows]).delete()
+
+    apply()
+
+
+def prune_activity_logs(days, archive_dir, chunk_size=1000, pause=0.05, progress=None):
+    """
+    `days` günden eski ham kayıtları işler; (işlenen kayıt, arşiv yolu) döner.
+    `pause`: parçalar arasında bekleme, diğer yazıcılara kilit fırsatı verir.
+    """
+    cutoff = retention_cutoff(days)
+    queryset = ActivityLog.objects.filter(created_at__lt=cutoff).order_by('id')
+    if not queryset.exists():
+        return 0, None
+
+    os.makedirs(archive_dir, exist_ok=True)
+    archive_path = os.path.join(
+        archive_dir,
+        f'activitylog-before-{cutoff:%Y%m%d}-{timezone.now():%Y%m%d%H%M%S}.jsonl.gz',
+    )
+    processed = 0
+    with gzip.open(archive_path, 'wt', encoding='utf-8') as archive:
+        while True:
+            rows = list(queryset.values(*ARCHIVE_FIELDS)[:chunk_size])
+            if not rows:
+                break
+            for row in rows:
+                archive.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+            archive.flush()
+
+            _apply_chunk(rows)
+            processed += len(rows)
+            if progress:
+                progress(processed)
+            if pause:
+                time.sleep(pause)
+    return processed, archive_path
+
+
+# Terk edilmiş quiz denemeleri
+def abandoned_attempts(hours):
+    cutoff = timezone.now() - datetime.timedelta(hours=hours)
+    return QuizAttempt.objects.filter(completed_at__isnull=True, started_at__lt=cutoff)
+
+
+def delete_abandoned_attempts(hours, chunk_size=500, pause=0.05, dry_run=False, progress=None):
+    """
+    `hours` saatten uzun süredir bitirilmemiş denemeleri (ve cevaplarını) parça
+    parça siler; quiz başlığına göre silinen deneme sayılarını döner.
+    """
+    removed = Counter()
+    queryset = abandoned_attempts(hours).order_by('id')
+    if dry_run:
+        for title, count in queryset.values_list('quiz__title').annotate(n=models.Count('id')).order_by():
+            removed[title] += count
+        return removed
+
+    @retry_on_locked
+    def delete_chunk(rows):
+        # Bu arada tamamlanan denemeler silinmez
+        titles = dict(rows)
+        ids = list(abandoned_attempts(hours).filter(id__in=titles).values_list('id', flat=True))
+        QuizAttempt.objects.filter(id__in=ids).delete()
+        return [titles[attempt_id] for attempt_id in ids]
+
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last_id).values_list('id', 'quiz__title')[:chunk_size])
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        removed.update(delete_chunk(rows))
+        if progress:
+            progress(sum(removed.values()))
+        if pause:
+            time.sleep(pause)
+    return removed
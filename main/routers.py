@@ -0,0 +1,32 @@
+from django.conf import settings
+
+
+# Yalnızca eklenen (append-only) log tabloları ayrı SQLite dosyasında tutulur.
+# Böylece log yazımları quiz gönderimleriyle aynı yazma kilidini paylaşmaz.
+LOG_MODELS = {'activitylog', 'activityrollup', 'chatmessage', 'contactmessage'}
+
+
+def is_log_model(app_label, model_name):
+    return app_label == 'main' and model_name in LOG_MODELS
+
+
+class LogDatabaseRouter:
+    def _db_for_model(self, model):
+        if is_log_model(model._meta.app_label, model._meta.model_name):
+            return settings.LOGS_DATABASE
+        return 'default'
+
+    def db_for_read(self, model, **hints):
+        return self._db_for_model(model)
+
+    def db_for_write(self, model, **hints):
+        return self._db_for_model(model)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Log kayıtları kullanıcıya veritabanları arası (kısıtsız) FK ile bağlı
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if is_log_model(app_label, model_name):
+            return db == settings.LOGS_DATABASE
+        return db == 'default'
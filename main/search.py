@@ -0,0 +1,149 @@
+"""
+SQLite FTS5 tam metin arama (quiz, soru ve bilgi kartları).
+
+İndeks `main_searchindex` sanal tablosundadır (migration 0010). Türkçe için:
+unicode61 tokenizer büyük/küçük harfi ve aksanları (ç, ğ, ö, ş, ü, İ) katlar;
+tokenizer'ın katlamadığı noktasız "ı" hem indekslenirken hem aranırken "i"ye
+çevrilir. Böylece "kosul", "koşul" ve "KOŞUL" aynı sonuçları verir. Bu nedenle
+parçacıklarda (snippet) "ı" harfi "i" olarak görünür.
+"""
+import re
+
+from django.db import connection, transaction
+from django.utils.html import escape
+
+from .models import Quiz, Question, KnowledgeCard
+
+TABLE = 'main_searchindex'
+KIND_QUIZ = 'quiz'
+KIND_QUESTION = 'question'
+KIND_CARD = 'card'
+
+# snippet() işaretleri; HTML kaçışından sonra <mark> ile değiştirilir
+_MARK_START = '\x02'
+_MARK_END = '\x03'
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def normalize(text):
+    return (text or '').replace('ı', 'i').replace('İ', 'i')
+
+
+def build_query(text):
+    """Kullanıcı girdisini güvenli bir FTS5 sorgusuna çevirir (önek eşleşmeli)."""
+    tokens = _TOKEN_RE.findall(normalize(text))
+    return ' '.join(f'"{token}"*' for token in tokens[:10])
+
+
+# İndeks kayıtları
+def _documents(instance):
+    if isinstance(instance, Quiz):
+        if instance.is_published:
+            yield KIND_QUIZ, instance.pk, instance.title, instance.title, instance.description
+    elif isinstance(instance, Question):
+        if instance.quiz.is_published:
+            yield KIND_QUESTION, instance.pk, instance.quiz.title, instance.quiz.title, instance.question_text
+    elif isinstance(instance, KnowledgeCard):
+        if instance.is_active:
+            yield KIND_CARD, instance.pk, instance.title, instance.title, instance.content
+
+
+def _kind(instance):
+    return {Quiz: KIND_QUIZ, Question: KIND_QUESTION, KnowledgeCard: KIND_CARD}[type(instance)]
+
+
+def _insert(cursor, documents):
+    cursor.executemany(
+        f'INSERT INTO {TABLE} (kind, object_id, display_title, title, body) VALUES (%s, %s, %s, %s, %s)',
+        [
+            (kind, object_id, display_title, normalize(title), normalize(body))
+            for kind, object_id, display_title, title, body in documents
+        ],
+    )
+
+
+def remove_object(instance):
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE} WHERE kind = %s AND object_id = %s', [_kind(instance), instance.pk])
+
+
+def index_object(instance):
+    with transaction.atomic():
+        remove_object(instance)
+        with connection.cursor() as cursor:
+            _insert(cursor, _documents(instance))
+
+
+def index_objects(model, ids, batch_size=500):
+    """Verilen kayıtları toplu olarak yeniden indeksler (içe aktarma gibi toplu yazımlar için)."""
+    ids = list(ids)
+    queryset = model.objects.all()
+    if model is Question:
+        queryset = queryset.select_related('quiz')
+    with transaction.atomic(), connection.cursor() as cursor:
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            cursor.execute(
+                f"DELETE FROM {TABLE} WHERE kind = %s AND object_id IN ({', '.join(['%s'] * len(chunk))})",
+                [_kind(model()), *chunk],
+            )
+            _insert(cursor, [document for instance in queryset.filter(pk__in=chunk) for document in _documents(instance)])
+
+
+def rebuild(batch_size=500):
+    """İndeksi sıfırdan kurar; indekslenen kayıt sayısını döner."""
+    total = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE}')
+        querysets = (
+            Quiz.objects.filter(is_published=True),
+            Question.objects.filter(quiz__is_published=True).select_related('quiz'),
+            KnowledgeCard.objects.filter(is_active=True),
+        )
+        for queryset in querysets:
+            batch = []
+            for instance in queryset.iterator(chunk_size=batch_size):
+                batch.extend(_documents(instance))
+                if len(batch) >= batch_size:
+                    _insert(cursor, batch)
+                    total += len(batch)
+                    batch = []
+            _insert(cursor, batch)
+            total += len(batch)
+        cursor.execute(f"INSERT INTO {TABLE} ({TABLE}) VALUES ('optimize')")
+    return total
+
+
+# Arama
+def search(text, kinds=None, limit=20):
+    """
+    (kind, object_id, başlık, parçacık HTML'i) listesi döner; en alakalı önce.
+    Başlık eşleşmeleri gövde eşleşmelerinden 5 kat ağırlıklıdır (bm25).
+    """
+    query = build_query(text)
+    if not query:
+        return []
+    sql = (
+        f'SELECT kind, object_id, display_title, '
+        f"snippet({TABLE}, 4, '{_MARK_START}', '{_MARK_END}', '…', 16) "
+        f'FROM {TABLE} WHERE {TABLE} MATCH %s'
+    )
+    params = [query]
+    if kinds:
+        sql += f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+        params.extend(kinds)
+    sql += f' ORDER BY bm25({TABLE}, 0, 0, 0, 5.0, 1.0) LIMIT %s'
+    params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [
+        {
+            'kind': kind,
+            'object_id': object_id,
+            'title': title,
+            'snippet': escape(snippet).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>'),
+        }
+        for kind, object_id, title, snippet in rows
+    ]
@@ -0,0 +1,101 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import jobs, search
+from .images import delete_variants
+from .cache import bump_version, invalidate_user, user_pages_version
+from .models import (
+    User, Category, Quiz, Question, KnowledgeCard, Badge, UserBadge, QuizAttempt,
+    ActivityLog, ActivityRollup, ChatMessage,
+)
+
+
+# Kullanıcı değişince/silinince önbellekteki oturum kullanıcısını temizle
+# (profil, şifre, hesap silme ve puan güncellemeleri kaydetme ile yapılır)
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+# Kullanıcı silinince log veritabanındaki kayıtlarını da sil
+# (veritabanları arası FK olduğu için CASCADE kullanılamıyor)
+@receiver(post_delete, sender=User)
+def delete_user_logs(sender, instance, **kwargs):
+    ActivityLog.objects.filter(user_id=instance.pk).delete()
+    ActivityRollup.objects.filter(user_id=instance.pk).delete()
+    ChatMessage.objects.filter(user_id=instance.pk).delete()
+
+
+# Katalog değişince katalog sürümünü artır (sayfa önbelleği geçersiz olur)
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Quiz)
+@receiver([post_save, post_delete], sender=Question)
+def bump_catalog_version(sender, **kwargs):
+    bump_version('catalog')
+
+
+# Koşullu GET damgaları (main/cache.py: conditional_page)
+# Yalnızca last_login güncellemesi (her girişte) sayfaları değiştirmez
+@receiver([post_save, post_delete], sender=User)
+def bump_user_page_versions(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    bump_version(user_pages_version(instance.pk))
+    if instance.role == 'student':
+        bump_version('leaderboard')
+
+
+@receiver([post_save, post_delete], sender=QuizAttempt)
+@receiver([post_save, post_delete], sender=UserBadge)
+def bump_owner_page_version(sender, instance, **kwargs):
+    bump_version(user_pages_version(instance.user_id))
+
+
+@receiver([post_save, post_delete], sender=Badge)
+def bump_badges_version(sender, **kwargs):
+    bump_version('badges')
+
+
+# Arama indeksini güncel tut (tam yeniden kurulum: rebuild_search_index)
+# Soru kayıtları quiz başlığını ve yayın durumunu taşır: quiz kaydında bunlar
+# değiştiyse quiz'in soruları toplu olarak yeniden indekslenir
+SEARCH_QUIZ_FIELDS = ('title', 'is_published')
+
+
+@receiver(pre_save, sender=Quiz)
+def remember_quiz_search_fields(sender, instance, update_fields=None, **kwargs):
+    instance._search_fields = None
+    if instance.pk and (update_fields is None or set(update_fields) & set(SEARCH_QUIZ_FIELDS)):
+        instance._search_fields = Quiz.objects.filter(pk=instance.pk).values_list(*SEARCH_QUIZ_FIELDS).first()
+
+
+@receiver(post_save, sender=Quiz)
+@receiver(post_save, sender=Question)
+@receiver(post_save, sender=KnowledgeCard)
+def update_search_index(sender, instance, **kwargs):
+    search.index_object(instance)
+    previous = getattr(instance, '_search_fields', None)
+    if sender is Quiz and previous and previous != tuple(getattr(instance, name) for name in SEARCH_QUIZ_FIELDS):
+        search.index_objects(Question, instance.questions.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Quiz)
+@receiver(post_delete, sender=Question)
+@receiver(post_delete, sender=KnowledgeCard)
+def remove_from_search_index(sender, instance, **kwargs):
+    search.remove_object(instance)
+
+
+# Soru görseli varyantları arka planda üretilir (main/images.py); güncel varyantlar atlanır
+@receiver(post_save, sender=Question)
+def build_question_image_variants(sender, instance, **kwargs):
+    if instance.image:
+        name = instance.image.name
+        transaction.on_commit(lambda: jobs.enqueue('image_variants', path=name))
+
+
+@receiver(post_delete, sender=Question)
+def delete_question_image_variants(sender, instance, **kwargs):
+    if instance.image:
+        delete_variants(instance.image.name)
@@ -0,0 +1,32 @@
+"""
+Arka plan işleri (main/jobs.py). Kuyruğa `jobs.enqueue('<ad>', ...)` ile eklenir.
+"""
+from .accounts import pending_deletions, purge_user
+from .images import forget_variants, generate_variants
+from .jobs import job
+from .models import User
+
+
+# Rozet değerlendirme: quiz gönderimini yavaşlatmasın diye istek dışında çalışır
+@job(priority=5)
+def award_badges(user_id):
+    from .views import check_and_award_badges
+    
+    user = User.objects.filter(pk=user_id).first()
+    if user is not None:
+        check_and_award_badges(user)
+
+
+# Hesap silme: veriler parça parça silinir (main/accounts.py)
+@job(priority=-5, timeout=3600)
+def purge_account(user_id):
+    user = pending_deletions().filter(pk=user_id).first()
+    if user is not None:
+        purge_user(user)
+
+
+# Soru görseli varyantları (main/images.py)
+@job(priority=-1, timeout=300)
+def image_variants(path):
+    if generate_variants(path):
+        forget_variants(path)
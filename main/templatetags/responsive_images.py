@@ -0,0 +1,36 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from ..images import available_variants
+
+register = template.Library()
+
+
+def _srcset(variants):
+    # Aynı genişlikte tek aday kalır (tarayıcılar yinelenen genişliği geçersiz sayar)
+    candidates = {}
+    for width, url in variants:
+        candidates.setdefault(width, url)
+    return ', '.join(f'{url} {width}w' for width, url in sorted(candidates.items()))
+
+
+# Görsel varyantlarıyla <picture> üretir; varyant yoksa özgün görsel gösterilir
+# Kullanım: {% responsive_image question.image alt="Soru görseli" class="..." sizes="28rem" %}
+@register.simple_tag
+def responsive_image(image, alt='', sizes='100vw', **attrs):
+    if not image:
+        return ''
+    webp, fallback = available_variants(image.name)
+    extra = format_html_join('', ' {}="{}"', attrs.items())
+    if not fallback:
+        return format_html('<img src="{}" alt="{}" loading="lazy"{}>', image.url, alt, extra)
+
+    webp_source = ''
+    if webp:
+        webp_source = format_html(
+            '<source type="image/webp" srcset="{}" sizes="{}">', _srcset(webp), sizes,
+        )
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}" alt="{}" loading="lazy" decoding="async"{}></picture>',
+        webp_source, fallback[-1][1], _srcset(fallback), sizes, alt, extra,
+    )
@@ -1,3 +1,24 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from main.management.commands.check_import_budget import load_budget, measure, probe
+
+
+# Açılış bütçesi: django.setup() + URLconf yükleme ayrı süreçte ölçülür (main/import_budget.json)
+class ImportBudgetTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.budget = load_budget()
+
+    def test_startup_time_and_memory(self):
+        measured = measure(runs=3)
+        self.assertLessEqual(measured['seconds'], self.budget['seconds'])
+        self.assertLessEqual(measured['rss_mb'], self.budget['rss_mb'])
+
+    def test_lazy_modules_not_loaded_at_startup(self):
+        modules = probe()['modules']
+        # Ölçüm URLconf'u da kapsar: görünüm modülleri yüklenmiş olmalı
+        self.assertIn('main.urls', modules)
+        for forbidden in self.budget['forbidden_modules']:
+            loaded = [name for name in modules if name == forbidden or name.startswith(forbidden + '.')]
+            self.assertEqual(loaded, [], f'{forbidden} açılışta yüklenmemeli')
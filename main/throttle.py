@@ -0,0 +1,182 @@
+"""
+Giriş, kayıt ve iletişim formları için istek sınırlama.
+
+Sayaçlar önbellekte kayan pencere (önceki pencere ağırlıklı) yöntemiyle tutulur;
+istekler veritabanına yazmaz. Sayaç add + incr ile artırılır: Redis/Memcached'de
+atomiktir; FileBasedCache'te aynı anda gelen isteklerde sayım eksik kalabilir
+(üretimde CACHE_BACKEND ile atomik incr'li bir arka uç seçin). Kural türleri:
+
+    ip           istemci IP'si
+    username     kullanıcı adı (farklı IP'lerden dağıtık şifre denemesine karşı, yüksek sınır)
+    username_ip  kullanıcı adı + IP (düşük sınır; başka istemcinin denemeleri
+                 öğrencinin kendi cihazından girişini bu kuralla engellemez)
+
+Sınır aşılınca istemci üstel artan bir süre engellenir. Engel kontrolü önbellekteki
+tek bir anahtarla, şifre hash'lemeden önce yapılır; engeller yetkililer için ayrıca
+ThrottleBlock tablosuna yazılır (yalnızca engel anında).
+"""
+import datetime
+import functools
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.shortcuts import render
+from django.utils import timezone
+
+from . import metrics
+from .db import retry_on_locked
+from .models import ThrottleBlock
+
+# Tekrar eden ihlaller bu süre boyunca hatırlanır: her seferinde engel süresi ikiye katlanır
+STRIKES_TTL = 86400
+
+
+def client_ip(request):
+    if settings.THROTTLE_TRUST_FORWARDED_FOR:
+        forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '')
+        if forwarded:
+            return forwarded.split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def identity(request, kind, username_field='username'):
+    if kind == 'ip':
+        return client_ip(request)
+    username = (request.POST.get(username_field) or '').strip().lower()[:200]
+    if not username or kind == 'username':
+        return username
+    return f'{username} / {client_ip(request)}'
+
+
+# Kayan pencere sayacı
+def _ident_hash(ident):
+    # Kullanıcı adı boşluk vb. içerebilir; anahtarlar her önbellek arka ucunda geçerli kalır
+    return hashlib.md5(ident.encode()).hexdigest()
+
+
+def _counter_key(scope, kind, ident, window):
+    return f'throttle:count:{scope}:{kind}:{_ident_hash(ident)}:{window}'
+
+
+def _hit(scope, kind, ident, period):
+    now = time.time()
+    window = int(now // period)
+    key = _counter_key(scope, kind, ident, window)
+    current = None
+    while current is None:
+        if cache.add(key, 1, timeout=period * 2):
+            current = 1
+        else:
+            try:
+                current = cache.incr(key)
+            except ValueError:
+                # Anahtar add ile incr arasında süresi dolup silindi: tekrar eklenir
+                continue
+    previous = cache.get(_counter_key(scope, kind, ident, window - 1), 0)
+    elapsed = (now % period) / period
+    return current + previous * (1 - elapsed)
+
+
+def reset(scope, kind, ident):
+    for period in {period for k, _, period in settings.THROTTLE_RULES.get(scope, ()) if k == kind}:
+        window = int(time.time() // period)
+        cache.delete_many([
+            _counter_key(scope, kind, ident, window),
+            _counter_key(scope, kind, ident, window - 1),
+        ])
+
+
+# Engeller
+def _block_key(scope, kind, ident):
+    return f'throttle:block:{scope}:{kind}:{_ident_hash(ident)}'
+
+
+def blocked_until(scope, idents):
+    """(tür, kimlik) çiftlerinden engelli olanın bitiş zamanını (epoch) döner."""
+    now = time.time()
+    blocks = cache.get_many([_block_key(scope, kind, ident) for kind, ident in idents])
+    return max((until for until in blocks.values() if until > now), default=None)
+
+
+@retry_on_locked
+def _record_block(scope, kind, ident):
+    # Tablo yalnızca engel anında yazılır; sayaçlar ve engel kontrolü önbellektedir
+    now = timezone.now()
+    block = ThrottleBlock.objects.filter(scope=scope, kind=kind, ident=ident).first()
+    if block is None:
+        block = ThrottleBlock(scope=scope, kind=kind, ident=ident, strikes=0)
+    elif block.blocked_at < now - datetime.timedelta(seconds=STRIKES_TTL):
+        block.strikes = 0
+    block.strikes += 1
+    duration = min(
+        settings.THROTTLE_LOCKOUT_BASE * (2 ** (block.strikes - 1)),
+        settings.THROTTLE_LOCKOUT_MAX,
+    )
+    block.blocked_at = now
+    block.until = now + datetime.timedelta(seconds=duration)
+    block.save()
+    return block.until.timestamp()
+
+
+def _block(scope, kind, ident):
+    until = _record_block(scope, kind, ident)
+    cache.set(_block_key(scope, kind, ident), until, timeout=math.ceil(until - time.time()))
+    metrics.inc('kesfet_throttle_blocks_total', {'scope': scope, 'kind': kind})
+    return until
+
+
+def active_blocks():
+    return [
+        {
+            'scope': block.scope, 'kind': block.kind, 'ident': block.ident,
+            'until': block.until.timestamp(), 'until_at': block.until, 'strikes': block.strikes,
+        }
+        for block in ThrottleBlock.objects.filter(until__gt=timezone.now()).order_by('-until')
+    ]
+
+
+def unblock(scope, kind, ident):
+    ThrottleBlock.objects.filter(scope=scope, kind=kind, ident=ident).delete()
+    cache.delete(_block_key(scope, kind, ident))
+    reset(scope, kind, ident)
+
+
+def check(request, scope, username_field='username'):
+    """İsteği sayar; engelliyse engelin bitiş zamanını, değilse None döner."""
+    rules = settings.THROTTLE_RULES.get(scope, ())
+    idents = []
+    for kind, limit, period in rules:
+        ident = identity(request, kind, username_field)
+        if ident:
+            idents.append((kind, limit, period, ident))
+    until = blocked_until(scope, [(kind, ident) for kind, _, _, ident in idents])
+    if until:
+        return until
+
+    for kind, limit, period, ident in idents:
+        if _hit(scope, kind, ident, period) > limit:
+            return _block(scope, kind, ident)
+    return None
+
+
+def throttle(scope, template_name, username_field='username'):
+    """POST isteklerini sınırlar; engellenen istemciye 429 ile formu tekrar gösterir."""
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method == 'POST' and settings.THROTTLE_ENABLED:
+                until = check(request, scope, username_field)
+                if until:
+                    retry_after = max(1, math.ceil(until - time.time()))
+                    minutes = math.ceil(retry_after / 60)
+                    messages.error(request, f'⏳ Çok fazla deneme yaptın. {minutes} dakika sonra tekrar dene.')
+                    response = render(request, template_name, status=429)
+                    response['Retry-After'] = str(retry_after)
+                    return response
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,5 +1,6 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import api, chatbot, dashboards, views
 
 urlpatterns = [
     # Ana sayfa ve auth
@@ -11,19 +12,33 @@ urlpatterns = [
     path('iletisim/', views.contact, name='contact'),
     path('toggle-theme/', views.toggle_theme, name='toggle_theme'),
     path('daily-knowledge/', views.daily_knowledge, name='daily_knowledge'),
-    path('chatbot/', views.chatbot_view, name='chatbot'),
+    path('chatbot/', chatbot.chatbot_view, name='chatbot'),
     
     # Dashboard
-    path('dashboard/', views.dashboard, name='dashboard'),
+    # ASGI altında pano sorguları aynı anda çalışır (main/dashboards.py)
+    path('dashboard/', dashboards.dashboard if settings.ASYNC_DASHBOARDS else views.dashboard, name='dashboard'),
     
     # Quiz işlemleri
     path('quizzes/', views.quiz_list, name='quiz_list'),
+    path('search/', views.search, name='search'),
     path('quiz/<int:quiz_id>/', views.quiz_detail, name='quiz_detail'),
     path('quiz/take/<int:attempt_id>/', views.quiz_take, name='quiz_take'),
+    path('quiz/take/<int:attempt_id>/autosave/', views.quiz_autosave, name='quiz_autosave'),
     path('quiz/result/<int:attempt_id>/', views.quiz_result, name='quiz_result'),
+    path('quiz/<int:quiz_id>/export/', views.quiz_export, name='quiz_export'),
     
     # Profil ve liderlik
     path('profile/', views.profile, name='profile'),
     path('leaderboard/', views.leaderboard, name='leaderboard'),
     path('settings/', views.settings, name='settings'),
+    
+    # JSON katalog API'si
+    path('api/categories/', api.category_list, name='api_category_list'),
+    path('api/quizzes/', api.quiz_list, name='api_quiz_list'),
+    path('api/quizzes/<int:quiz_id>/', api.quiz_detail, name='api_quiz_detail'),
+    
+    # İzleme
+    path('throttle/blocks/', views.throttle_blocks, name='throttle_blocks'),
+    path('metrics', views.metrics_view, name='metrics'),
+    path('ready', views.ready_view, name='ready'),
 ]
\ No newline at end of file
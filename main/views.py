@@ -1,15 +1,34 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.text import slugify
+from django.views.decorators.cache import never_cache
+from django.db import DatabaseError, connections
 from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
 from django.utils import timezone
-from django.db.models import Count, Avg, Sum
+from django.db.models import Count, Avg, Sum, F
 from datetime import timedelta
 from .models import *
-import google.generativeai as genai
+import random
 from config import settings
+from . import metrics
+from .db import retry_on_locked
+from .cache import cache_page_for_anonymous, conditional_page
+from .throttle import throttle
+from . import throttle as throttling
+from . import search as fulltext
+from . import jobs
+from . import points
+from . import export
+from . import dashboards
+from . import warmup
+from .accounts import request_deletion
+from .activity import log_activity
 
 # Ana Sayfa
+@cache_page_for_anonymous
 def home(request):
     if request.user.is_authenticated:
         return redirect('dashboard')
@@ -25,6 +44,7 @@ def home(request):
 
 
 # Kayıt
+@throttle('register', 'register.html')
 def register(request):
     if request.method == 'POST':
         username = request.POST.get('username')
@@ -52,6 +72,7 @@ def register(request):
 
 
 # Giriş
+@throttle('login', 'login.html')
 def user_login(request):
     if request.method == 'POST':
         username = request.POST.get('username')
@@ -60,6 +81,8 @@ def user_login(request):
         
         if user is not None:
             login(request, user)
+            for kind in ('username', 'username_ip'):
+                throttling.reset('login', kind, throttling.identity(request, kind))
             return redirect('dashboard')
         else:
             messages.error(request, 'Kullanıcı adı veya şifre hatalı.')
@@ -88,140 +111,56 @@ def dashboard(request):
     return render(request, 'dashboard.html')
 
 
-# Öğrenci Dashboard
+# Öğrenci Dashboard (sorgular main/dashboards.py; async sürümü de oradadır)
 @login_required
 def student_dashboard(request):
-    from datetime import date
-    
-    user = request.user
-    
-    # İstatistikler
-    total_attempts = QuizAttempt.objects.filter(user=user, completed_at__isnull=False).count()
-    passed_quizzes = QuizAttempt.objects.filter(user=user, is_passed=True).count()
-    total_quizzes = Quiz.objects.filter(is_published=True).count()
-    
-    # Son denemeler
-    recent_attempts = QuizAttempt.objects.filter(
-        user=user,
-        completed_at__isnull=False
-    ).select_related('quiz').order_by('-completed_at')[:5]
-    
-    # Rozetler
-    user_badges = UserBadge.objects.filter(user=user).select_related('badge').order_by('-earned_at')
-    
-    # Son aktiviteler
-    recent_activities = ActivityLog.objects.filter(user=user).order_by('-created_at')[:10]
-    
-    # Haftalık ilerleme
-    week_ago = timezone.now() - timedelta(days=7)
-    weekly_attempts = QuizAttempt.objects.filter(
-        user=user,
-        completed_at__gte=week_ago,
-        completed_at__isnull=False
-    ).count()
-    
-    # Günün Bilgisi İstatistikleri
-    today = date.today()
-    daily_limit = DailyCardLimit.objects.filter(user=user, date=today).first()
-    daily_cards_today = daily_limit.cards_read_today if daily_limit else 0
-    total_cards_read = UserCardRead.objects.filter(user=user).count()
-    total_cards = KnowledgeCard.objects.filter(is_active=True).count()
-    cards_remaining = total_cards - total_cards_read
-    
-    context = {
-        'total_attempts': total_attempts,
-        'passed_quizzes': passed_quizzes,
-        'total_quizzes': total_quizzes,
-        'success_rate': (passed_quizzes / total_attempts * 100) if total_attempts > 0 else 0,
-        'recent_attempts': recent_attempts,
-        'user_badges': user_badges,
-        'recent_activities': recent_activities,
-        'weekly_attempts': weekly_attempts,
-        # Günün Bilgisi
-        'daily_cards_today': daily_cards_today,
-        'total_cards_read': total_cards_read,
-        'cards_remaining': cards_remaining,
-    }
-    
+    context = dashboards.student_context(dashboards.run_all(dashboards.student_queries(request.user)))
     return render(request, 'student_dashboard.html', context)
 
 # Veli Dashboard
 @login_required
 def parent_dashboard(request):
-    children = ParentStudent.objects.filter(parent=request.user).select_related('student')
-    
-    children_data = []
-    for relation in children:
-        child = relation.student
-        
-        total_attempts = QuizAttempt.objects.filter(
-            user=child,
-            completed_at__isnull=False
-        ).count()
-        
-        passed = QuizAttempt.objects.filter(user=child, is_passed=True).count()
-        
-        recent_quiz = QuizAttempt.objects.filter(
-            user=child,
-            completed_at__isnull=False
-        ).order_by('-completed_at').first()
-        
-        # Son 7 gün aktivite
-        week_ago = timezone.now() - timedelta(days=7)
-        weekly_quizzes = QuizAttempt.objects.filter(
-            user=child,
-            completed_at__gte=week_ago,
-            completed_at__isnull=False
-        ).count()
-        
-        children_data.append({
-            'child': child,
-            'total_attempts': total_attempts,
-            'passed_quizzes': passed,
-            'success_rate': (passed / total_attempts * 100) if total_attempts > 0 else 0,
-            'recent_quiz': recent_quiz,
-            'weekly_quizzes': weekly_quizzes,
-        })
-    
-    context = {'children_data': children_data}
+    children = [
+        relation.student
+        for relation in ParentStudent.objects.filter(parent=request.user).select_related('student')
+    ]
+    context = dashboards.parent_context(children, dashboards.run_all(dashboards.parent_queries(children)))
     return render(request, 'parent_dashboard.html', context)
 
 
 # Öğretmen Dashboard
 @login_required
 def teacher_dashboard(request):
-    total_students = User.objects.filter(role='student').count()
-    total_quizzes = Quiz.objects.filter(created_by=request.user).count()
-    total_attempts = QuizAttempt.objects.filter(
-        quiz__created_by=request.user,
-        completed_at__isnull=False
-    ).count()
-    
-    # Öğretmenin oluşturduğu quiz'lerin son denemeleri
-    recent_attempts = QuizAttempt.objects.filter(
-        quiz__created_by=request.user,
-        completed_at__isnull=False
-    ).select_related('user', 'quiz').order_by('-completed_at')[:10]
-    
-    # Quiz istatistikleri
-    my_quizzes = Quiz.objects.filter(created_by=request.user).annotate(
-        attempt_count=Count('attempts'),
-        avg_score=Avg('attempts__percentage')
-    )
-    
-    context = {
-        'total_students': total_students,
-        'total_quizzes': total_quizzes,
-        'total_attempts': total_attempts,
-        'recent_attempts': recent_attempts,
-        'my_quizzes': my_quizzes,
-    }
-    
+    context = dashboards.run_all(dashboards.teacher_queries(request.user))
     return render(request, 'teacher_dashboard.html', context)
 
 
+# Quiz Sonuçlarını Dışa Aktar (yalnızca quiz'i oluşturan öğretmen; satırlar akış halinde gönderilir)
+@login_required
+def quiz_export(request, quiz_id):
+    quiz = get_object_or_404(Quiz, id=quiz_id, created_by=request.user)
+    questions = list(quiz.questions.order_by('order', 'id').values_list('id', flat=True))
+    header = export.attempt_header(questions)
+    rows = export.attempt_rows(quiz, questions)
+    filename = f'{slugify(quiz.title) or "quiz"}-sonuclar'
+    
+    if request.GET.get('format') == 'xlsx':
+        response = StreamingHttpResponse(
+            export.xlsx_stream(header, rows),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+        filename += '.xlsx'
+    else:
+        response = StreamingHttpResponse(export.csv_stream(header, rows), content_type='text/csv; charset=utf-8')
+        filename += '.csv'
+    
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 # Quiz Listesi
 @login_required
+@conditional_page('catalog')
 def quiz_list(request):
     categories = Category.objects.prefetch_related('quizzes').all()
     
@@ -245,8 +184,32 @@ def quiz_list(request):
     return render(request, 'quiz_list.html', context)
 
 
+# Arama
+@login_required
+def search(request):
+    query = request.GET.get('q', '').strip()
+    results = fulltext.search(query, limit=30) if query else []
+    
+    # Soru sonuçları ait oldukları quiz'e bağlanır
+    question_ids = [r['object_id'] for r in results if r['kind'] == fulltext.KIND_QUESTION]
+    question_quiz = dict(Question.objects.filter(id__in=question_ids).values_list('id', 'quiz_id'))
+    for result in results:
+        if result['kind'] == fulltext.KIND_QUIZ:
+            result['quiz_id'] = result['object_id']
+        elif result['kind'] == fulltext.KIND_QUESTION:
+            result['quiz_id'] = question_quiz.get(result['object_id'])
+    
+    context = {
+        'query': query,
+        'results': results,
+    }
+    
+    return render(request, 'search.html', context)
+
+
 # Quiz Detay & Başlat
 @login_required
+@conditional_page('catalog')
 def quiz_detail(request, quiz_id):
     quiz = get_object_or_404(Quiz, id=quiz_id, is_published=True)
     
@@ -260,25 +223,58 @@ def quiz_detail(request, quiz_id):
     best_attempt = previous_attempts.filter(is_passed=True).first()
     
     if request.method == 'POST':
-        # Yeni deneme başlat
-        max_score = sum(q.points for q in quiz.questions.all())
-        attempt = QuizAttempt.objects.create(
-            user=request.user,
-            quiz=quiz,
-            max_score=max_score
-        )
+        attempt = start_attempt(request.user, quiz)
         return redirect('quiz_take', attempt_id=attempt.id)
     
     context = {
         'quiz': quiz,
         'previous_attempts': previous_attempts[:5],
         'best_attempt': best_attempt,
-        'question_count': quiz.questions.count(),
+        'question_count': quiz.attempt_question_count(),
     }
     
     return render(request, 'quiz_detail.html', context)
 
 
+# Soru Bankasından Seçim
+# ORDER BY RANDOM() tüm satırları sıralar; bunun yerine yalnızca (id, puan) çiftleri
+# (quiz_id indeksinden) okunur ve örnekleme Python'da yapılır
+def sample_questions(quiz):
+    """(soru id'leri, maksimum puan) döner; örnekleme yoksa id listesi boştur (tüm sorular)."""
+    bank = list(quiz.questions.order_by().values_list('id', 'points'))
+    if quiz.questions_per_attempt and quiz.questions_per_attempt < len(bank):
+        # Gösterim sırası get_questions() ile bankadaki sıradan gelir
+        bank = random.sample(bank, quiz.questions_per_attempt)
+        return sorted(question_id for question_id, _ in bank), sum(points for _, points in bank)
+    return [], sum(points for _, points in bank)
+
+
+# Deneme Başlat: yarım kalan deneme varsa ona devam edilir (cevaplar otomatik kaydedilmiştir)
+@retry_on_locked
+def start_attempt(user, quiz):
+    from django.conf import settings as django_settings
+    
+    cutoff = timezone.now() - timedelta(hours=django_settings.ABANDONED_ATTEMPT_HOURS)
+    attempt = QuizAttempt.objects.filter(
+        user=user,
+        quiz=quiz,
+        completed_at__isnull=True,
+        started_at__gte=cutoff,
+    ).order_by('-started_at').first()
+    
+    if attempt is None:
+        question_ids, max_score = sample_questions(quiz)
+        return QuizAttempt.objects.create(user=user, quiz=quiz, max_score=max_score, question_ids=question_ids)
+    
+    # Denemenin soruları sabittir; sorular değiştiyse (silinme, puan) maksimum puan güncellenir
+    attempt.max_score = attempt.get_questions().aggregate(total=Sum('points'))['total'] or 0
+    # Süre (time_spent) kaldığı yerden devam edilen andan ölçülür; terk edilip saatler
+    # sonra dönülen deneme aradaki süreyi saymaz
+    attempt.started_at = timezone.now()
+    attempt.save(update_fields=['max_score', 'started_at'])
+    return attempt
+
+
 # Quiz Çöz
 @login_required
 def quiz_take(request, attempt_id):
@@ -287,58 +283,19 @@ def quiz_take(request, attempt_id):
     if attempt.completed_at:
         return redirect('quiz_result', attempt_id=attempt_id)
     
-    questions = attempt.quiz.questions.prefetch_related('answers').all()
+    questions = attempt.get_questions().prefetch_related('answers')
     
     if request.method == 'POST':
-        score = 0
-        
-        for question in questions:
-            answer_id = request.POST.get(f'question_{question.id}')
-            
-            if answer_id:
-                answer = get_object_or_404(Answer, id=answer_id)
-                is_correct = answer.is_correct
-                
-                UserAnswer.objects.create(
-                    attempt=attempt,
-                    question=question,
-                    selected_answer=answer,
-                    is_correct=is_correct
-                )
-                
-                if is_correct:
-                    score += question.points
-        
-        # Denemeyi tamamla
-        attempt.score = score
-        attempt.percentage = (score / attempt.max_score * 100) if attempt.max_score > 0 else 0
-        attempt.is_passed = attempt.percentage >= attempt.quiz.passing_score
-        attempt.completed_at = timezone.now()
-        
-        # Süre hesapla
-        time_diff = attempt.completed_at - attempt.started_at
-        attempt.time_spent = int(time_diff.total_seconds())
-        
-        attempt.save()
-        
-        # Başarılıysa puan ekle
-        if attempt.is_passed:
-            request.user.total_points += attempt.quiz.points_reward
-            request.user.save()
-            
-            # Aktivite logu
-            ActivityLog.objects.create(
-                user=request.user,
-                activity_type='quiz_completed',
-                description=f'{attempt.quiz.title} quiz\'ini tamamladı',
-                points_earned=attempt.quiz.points_reward
-            )
-            
-            # Rozet kontrolü
-            check_and_award_badges(request.user)
+        if submit_attempt(request, attempt, questions):
+            metrics.record_quiz_submission(attempt.is_passed)
         
         return redirect('quiz_result', attempt_id=attempt_id)
     
+    # Otomatik kaydedilmiş cevaplar sayfa yenilense de seçili gelir
+    selected = dict(attempt.user_answers.values_list('question_id', 'selected_answer_id'))
+    for question in questions:
+        question.selected_answer_id = selected.get(question.id)
+    
     context = {
         'attempt': attempt,
         'questions': questions,
@@ -348,6 +305,107 @@ def quiz_take(request, attempt_id):
     return render(request, 'quiz_take.html', context)
 
 
+# Cevapları Otomatik Kaydet (tarayıcı değişen cevapları toplu gönderir)
+@login_required
+def quiz_autosave(request, attempt_id):
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Yalnızca POST'}, status=405)
+    
+    attempt = get_object_or_404(QuizAttempt, id=attempt_id, user=request.user)
+    if attempt.completed_at:
+        return JsonResponse({'error': 'Quiz zaten tamamlandı'}, status=409)
+    
+    saved = retry_on_locked(save_answers)(attempt, request.POST)
+    return JsonResponse({'saved': saved})
+
+
+def save_answers(attempt, data):
+    """
+    `question_<id>` alanlarındaki cevapları tek sorguda ekler ya da günceller
+    (attempt, question tekil). Denemede sorulmayan soru/cevaplar yok sayılır.
+    """
+    chosen = {}
+    for key, value in data.items():
+        if key.startswith('question_') and key[9:].isdigit() and value.isdigit():
+            chosen[int(key[9:])] = int(value)
+    if not chosen:
+        return 0
+    
+    if attempt.question_ids:
+        asked = set(attempt.question_ids)
+        chosen = {question_id: answer_id for question_id, answer_id in chosen.items() if question_id in asked}
+    answers = Answer.objects.filter(
+        id__in=chosen.values(),
+        question_id__in=chosen.keys(),
+        question__quiz_id=attempt.quiz_id,
+    ).values_list('id', 'question_id', 'is_correct')
+    now = timezone.now()
+    user_answers = [
+        UserAnswer(
+            attempt=attempt,
+            question_id=question_id,
+            selected_answer_id=answer_id,
+            is_correct=is_correct,
+            answered_at=now,
+        )
+        for answer_id, question_id, is_correct in answers
+        if chosen[question_id] == answer_id
+    ]
+    UserAnswer.objects.bulk_create(
+        user_answers,
+        update_conflicts=True,
+        unique_fields=['attempt', 'question'],
+        update_fields=['selected_answer', 'is_correct', 'answered_at'],
+    )
+    return len(user_answers)
+
+
+# Quiz Gönderimi (tek transaction, kilit çakışmasında yeniden denenir)
+@retry_on_locked
+def submit_attempt(request, attempt, questions):
+    """Denemeyi tamamlar; deneme başka bir istekte zaten tamamlandıysa False döner."""
+    # Deneme koşullu UPDATE ile sahiplenilir: çift tıklama ya da aynı anda gelen
+    # iki gönderimden yalnızca biri puan verir
+    now = timezone.now()
+    if not QuizAttempt.objects.filter(pk=attempt.pk, completed_at__isnull=True).update(completed_at=now):
+        return False
+    
+    # Son gönderimdeki cevaplar da kaydedilir (JavaScript kapalıysa tek kaynak budur);
+    # puan yalnızca kayıtlı cevaplardan hesaplanır
+    save_answers(attempt, request.POST)
+    score = attempt.user_answers.filter(is_correct=True).aggregate(
+        total=Sum('question__points')
+    )['total'] or 0
+    
+    # Denemeyi tamamla
+    attempt.score = score
+    attempt.percentage = (score / attempt.max_score * 100) if attempt.max_score > 0 else 0
+    attempt.is_passed = attempt.percentage >= attempt.quiz.passing_score
+    attempt.completed_at = now
+    
+    # Süre hesapla
+    time_diff = attempt.completed_at - attempt.started_at
+    attempt.time_spent = int(time_diff.total_seconds())
+    
+    attempt.save()
+    
+    # Başarılıysa puan ekle
+    if attempt.is_passed:
+        points.award(request.user, attempt.quiz.points_reward, 'quiz_passed', attempt.quiz.title)
+        
+        # Aktivite logu
+        log_activity(
+            user=request.user,
+            activity_type='quiz_completed',
+            description=f'{attempt.quiz.title} quiz\'ini tamamladı',
+            points_earned=attempt.quiz.points_reward
+        )
+        
+        # Rozet kontrolü (arka plan işi, main/tasks.py)
+        jobs.enqueue('award_badges', user_id=request.user.id)
+    return True
+
+
 # Quiz Sonuç
 @login_required
 def quiz_result(request, attempt_id):
@@ -408,7 +466,7 @@ def check_and_award_badges(user):
             UserBadge.objects.create(user=user, badge=badge)
             
             # Aktivite logu
-            ActivityLog.objects.create(
+            log_activity(
                 user=user,
                 activity_type='badge_earned',
                 description=f'{badge.name} rozetini kazandı',
@@ -420,6 +478,7 @@ def check_and_award_badges(user):
 
 # Profil
 @login_required
+@conditional_page('badges')
 def profile(request):
     user_badges = UserBadge.objects.filter(user=request.user).select_related('badge')
     
@@ -448,6 +507,7 @@ def profile(request):
 
 # Liderlik Tablosu
 @login_required
+@conditional_page('leaderboard')
 def leaderboard(request):
     top_students = User.objects.filter(role='student').order_by('-total_points')[:20]
     
@@ -459,10 +519,13 @@ def leaderboard(request):
     return render(request, 'leaderboard.html', context)
 
 # Hakkında
+@cache_page_for_anonymous
 def about(request):
     return render(request, 'about.html')
 
 # İletişim
+@cache_page_for_anonymous
+@throttle('contact', 'contact.html', username_field='email')
 def contact(request):
     if request.method == 'POST':
         name = request.POST.get('name')
@@ -482,6 +545,20 @@ def contact(request):
     
     return render(request, 'contact.html')
 
+# İstek sınırı engelleri (yetkililer için)
+@staff_member_required
+def throttle_blocks(request):
+    if request.method == 'POST':
+        throttling.unblock(request.POST.get('scope'), request.POST.get('kind'), request.POST.get('ident'))
+        messages.success(request, '✅ Engel kaldırıldı.')
+        return redirect('throttle_blocks')
+    
+    context = {
+        'blocks': throttling.active_blocks(),
+    }
+    
+    return render(request, 'throttle_blocks.html', context)
+
 # Ayarlar
 @login_required
 def settings(request):
@@ -551,7 +628,11 @@ def settings(request):
                 messages.error(request, '❌ Şifreniz hatalı!')
                 return redirect('settings')
             
-            request.user.delete()
+            # Hesap hemen kapatılır; veriler arka planda parça parça silinir (main/accounts.py)
+            user_id = request.user.id
+            request_deletion(request.user)
+            logout(request)
+            jobs.enqueue('purge_account', user_id=user_id)
             messages.success(request, '✅ Hesabınız başarıyla silindi.')
             return redirect('home')
     
@@ -619,24 +700,7 @@ def daily_knowledge(request):
     
     # Kart okundu olarak işaretle
     if request.method == 'POST' and current_card and not limit_reached:
-        # Kartı okundu olarak kaydet
-        UserCardRead.objects.get_or_create(user=request.user, card=current_card)
-        
-        # Günlük sayacı artır
-        daily_limit.cards_read_today += 1
-        daily_limit.save()
-        
-        # Puan ekle
-        request.user.total_points += 5
-        request.user.save()
-        
-        # Aktivite logu
-        ActivityLog.objects.create(
-            user=request.user,
-            activity_type='card_read',
-            description=f'"{current_card.title}" kartını okudu',
-            points_earned=5
-        )
+        record_card_read(request, daily_limit, current_card)
         
         messages.success(request, f'✅ +5 Puan kazandın! ({daily_limit.cards_read_today}/5)')
         return redirect('daily_knowledge')
@@ -656,75 +720,52 @@ def daily_knowledge(request):
     
     return render(request, 'daily_knowledge.html', context)
 
-@login_required
-def chatbot_view(request):
-    if request.method == 'POST':
-        try:
-            user_message = request.POST.get('message', '').strip()
-            
-            if not user_message:
-                return JsonResponse({
-                    'error': 'Mesaj boş olamaz!'
-                }, status=400)
-            
-            # Gemini API Key'i al
-            from django.conf import settings as django_settings
-            api_key = django_settings.GEMINI_API_KEY
-            
-            # ✅ TEST: API key'i konsola yazdır
-            print(f"DEBUG - API KEY: {api_key}")
-            print(f"DEBUG - API KEY uzunluğu: {len(api_key)}")
-            
-            # Gemini AI yapılandırması
-            genai.configure(api_key=api_key)
-            
-            # GÜNCEL MODEL - gemini-2.0-flash
-            model = genai.GenerativeModel('gemini-2.0-flash')
-            
-            # KISA Sistem promptu
-            system_prompt = f"""Sen KesfetBot'sun 🤖 - Çocuklar için eğlenceli AI asistan.
-
-ÖNEMLI KURALLAR:
-- Cevapların MAKSIMUM 3-4 CÜMLE olmalı
-- Çok kısa ve öz açıkla
-- Sade Türkçe kullan
-- 2-3 emoji yeterli
-
-Kullanıcı: {request.user.username} ({request.user.total_points} puan)
 
-Soru: {user_message}
-
-KISA cevap ver!"""
-            
-            # AI'dan cevap al
-            response = model.generate_content(system_prompt)
-            ai_response = response.text
-            
-            # Mesajı kaydet
-            ChatMessage.objects.create(
-                user=request.user,
-                message=user_message,
-                response=ai_response
-            )
-            
-            return JsonResponse({
-                'success': True,
-                'response': ai_response
-            })
-            
-        except Exception as e:
-            print(f"CHATBOT HATASI: {e}")
-            import traceback
-            traceback.print_exc()
-            return JsonResponse({
-                'error': f'Bir hata oluştu: {str(e)}'
-            }, status=500)
+# Kart Okuma Kaydı (tek transaction, kilit çakışmasında yeniden denenir)
+@retry_on_locked
+def record_card_read(request, daily_limit, card):
+    # Kartı okundu olarak kaydet
+    UserCardRead.objects.get_or_create(user=request.user, card=card)
     
-    # GET request - chat geçmişini göster
-    chat_history = ChatMessage.objects.filter(user=request.user).order_by('-created_at')[:20]
+    # Günlük sayacı artır
+    DailyCardLimit.objects.filter(pk=daily_limit.pk).update(cards_read_today=F('cards_read_today') + 1)
+    daily_limit.refresh_from_db(fields=['cards_read_today'])
     
-    context = {
-        'chat_history': chat_history,
-    }
+    # Puan ekle
+    points.award(request.user, 5, 'card_read', card.title)
     
-    return render(request, 'chatbot.html', context)
\ No newline at end of file
+    # Aktivite logu
+    log_activity(
+        user=request.user,
+        activity_type='card_read',
+        description=f'"{card.title}" kartını okudu',
+        points_earned=5
+    )
+
+# Prometheus metrikleri
+def metrics_view(request):
+    from django.conf import settings as django_settings
+    from django.http import HttpResponse
+    
+    token = django_settings.METRICS_TOKEN
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse(status=401)
+    
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# Hazır olma kontrolü: yük dengeleyici worker ısınana kadar trafik göndermez
+@never_cache
+def ready_view(request):
+    warmup.start()
+    if not warmup.is_ready():
+        return JsonResponse({'status': 'warming'}, status=503)
+    
+    # Veritabanları gerçekten sorgulanabiliyor mu (bağlantı CONN_MAX_AGE'e göre açık kalır ya da kapanır)
+    try:
+        for alias in connections:
+            with connections[alias].cursor() as cursor:
+                cursor.execute('SELECT 1')
+    except DatabaseError:
+        return JsonResponse({'status': 'database unavailable'}, status=503)
+    return JsonResponse({'status': 'ready'})
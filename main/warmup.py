@@ -0,0 +1,155 @@
+"""
+Worker ısınması: dağıtımdan sonra ilk isteklerin gecikme yaşamaması için
+worker başlarken (config/wsgi.py, config/asgi.py) arka planda çalışır.
+
+    - URLconf ve ters URL tablosu, statik dosya manifest'i yüklenir
+    - proje şablonları derlenip şablon önbelleğine alınır
+    - veritabanı bağlantıları açılır (connection_created ile pragmalar uygulanır)
+    - sürüm damgaları, anonim sayfa önbelleği (ana sayfa, Hakkımızda, İletişim)
+      ve katalog/liderlik tablosu sorguları ısıtılır
+
+Isınma bitene kadar /ready 503 döner; yük dengeleyici o worker'a trafik
+göndermez. Bir adım hata verirse kaydedilir ve ısınma devam eder.
+
+Thread'ler ve veritabanı bağlantıları fork'tan sonra kullanılamaz; bu yüzden
+ısınma fork edilen her süreçte (os.register_at_fork) yeniden başlatılır.
+WARMUP_PRELOAD=True iken (gunicorn --preload) uygulamayı yükleyen ana süreç
+hiç ısınmaz: açtığı bağlantılar worker'lara miras kalmaz.
+"""
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_ready = threading.Event()
+_pid = None
+_installed = False
+
+
+# Adımlar
+def load_urls():
+    from django.urls import get_resolver, reverse
+
+    get_resolver().url_patterns
+    # Ters URL tablosu ilk reverse() çağrısında kurulur
+    reverse('home')
+
+
+def load_static_manifest():
+    from django.contrib.staticfiles.storage import staticfiles_storage
+
+    staticfiles_storage.url('css/tailwind.css')
+
+
+def compile_templates():
+    from django.template import engines
+
+    # Şablonlar şablon önbelleğine (cached loader) derlenmiş halde girer
+    engine = engines['django']
+    for directory in engine.engine.dirs:
+        for path in sorted(Path(directory).rglob('*.html')):
+            engine.get_template(path.relative_to(directory).as_posix())
+
+
+def open_connections():
+    for alias in connections:
+        connections[alias].ensure_connection()
+
+
+def prime_caches():
+    from django.contrib.auth.models import AnonymousUser
+    from django.http import HttpRequest
+
+    from . import views
+    from .cache import get_version
+    from .models import Quiz, User
+
+    for name in ('catalog', 'leaderboard', 'badges'):
+        get_version(name)
+
+    # Anonim sayfa önbelleği (tüm worker'larca paylaşılır)
+    host = next((host for host in settings.ALLOWED_HOSTS if '*' not in host), 'localhost')
+    for path, view in (('/', views.home), ('/Hakkimizda/', views.about), ('/iletisim/', views.contact)):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.path = request.path_info = path
+        request.META = {'SERVER_NAME': host.lstrip('.'), 'SERVER_PORT': '80', 'REMOTE_ADDR': '127.0.0.1'}
+        request.user = AnonymousUser()
+        view(request)
+
+    # Katalog ve liderlik tablosu sorgularının sayfaları SQLite önbelleğine alınır
+    list(Quiz.objects.filter(is_published=True).select_related('category'))
+    list(User.objects.filter(role='student').order_by('-total_points')[:20])
+
+
+STEPS = (
+    ('urls', load_urls),
+    ('static', load_static_manifest),
+    ('templates', compile_templates),
+    ('database', open_connections),
+    ('caches', prime_caches),
+)
+
+
+def run():
+    started = time.monotonic()
+    for name, step in STEPS:
+        step_started = time.monotonic()
+        try:
+            step()
+        except Exception:
+            logger.exception('Isınma adımı başarısız: %s', name)
+        else:
+            logger.info('Isınma adımı %s: %.0f ms', name, (time.monotonic() - step_started) * 1000)
+    # Bu thread'in bağlantıları kapatılır; istek thread'leri kendi bağlantılarını /ready'de açar
+    connections.close_all()
+    metrics.observe('kesfet_warmup_duration_seconds', time.monotonic() - started)
+    _ready.set()
+
+
+def start(background=True):
+    """Isınmayı süreç başına bir kez başlatır (fork sonrası yeni süreçte tekrar)."""
+    global _pid
+    with _lock:
+        if _pid == os.getpid():
+            return
+        _pid = os.getpid()
+        _ready.clear()
+
+    if not settings.WARMUP_ENABLED:
+        _ready.set()
+    elif background:
+        threading.Thread(target=run, name='warmup', daemon=True).start()
+    else:
+        run()
+
+
+def _after_fork():
+    global _lock, _ready
+    # Fork anında başka bir thread'in tuttuğu kilit çocuk süreçte hiç bırakılmaz
+    _lock = threading.Lock()
+    _ready = threading.Event()
+    start()
+
+
+def install():
+    """Sunucu girişinde (config/wsgi.py, config/asgi.py) çağrılır."""
+    global _installed
+    if not _installed:
+        _installed = True
+        os.register_at_fork(after_in_child=_after_fork)
+    if not settings.WARMUP_PRELOAD:
+        start()
+
+
+def is_ready():
+    return _pid == os.getpid() and _ready.is_set()
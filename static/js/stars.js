@@ -0,0 +1,38 @@
+// JavaScript ile rastgele yıldızlar oluştur
+const starsContainer = document.querySelector('.stars-layer-1');
+const starCount = 150;
+
+for (let i = 0; i < starCount; i++) {
+    const star = document.createElement('div');
+    star.className = 'star';
+    
+    // Rastgele boyut
+    const sizeType = Math.random();
+    if (sizeType < 0.6) {
+        star.classList.add('star-small');
+    } else if (sizeType < 0.9) {
+        star.classList.add('star-medium');
+    } else {
+        star.classList.add('star-large');
+    }
+    
+    // Rastgele renk
+    const colorType = Math.random();
+    if (colorType < 0.7) {
+        // Beyaz yıldız (çoğunluk)
+    } else if (colorType < 0.85) {
+        star.classList.add('star-purple');
+    } else {
+        star.classList.add('star-blue');
+    }
+    
+    // Rastgele pozisyon
+    star.style.top = Math.random() * 100 + '%';
+    star.style.left = Math.random() * 100 + '%';
+    
+    // Rastgele animasyon süresi ve gecikmesi
+    star.style.setProperty('--duration', (2 + Math.random() * 4) + 's');
+    star.style.setProperty('--delay', Math.random() * 3 + 's');
+    
+    starsContainer.appendChild(star);
+}
@@ -0,0 +1,66 @@
+// Tema kontrolü - hem giriş yapmış hem yapmamış kullanıcılar için
+// <head> içinde yüklenir; sayfa çizilmeden önce tema uygulanır.
+(function initTheme() {
+    const root = document.documentElement;
+    const userTheme = root.dataset.userTheme;
+
+    if (userTheme) {
+        // Giriş yapmış kullanıcı - veritabanından al
+        if (userTheme === 'dark') {
+            root.classList.add('dark-theme');
+        }
+        localStorage.setItem('theme', userTheme);
+    } else {
+        // Giriş yapmamış kullanıcı - localStorage'dan al
+        if (localStorage.getItem('theme') === 'dark') {
+            root.classList.add('dark-theme');
+        }
+    }
+})();
+
+// Giriş yapmış kullanıcı için tercihi veritabanına kaydet
+function saveThemePreference(darkMode) {
+    const url = document.documentElement.dataset.themeUrl;
+    const csrfToken = document.querySelector('meta[name="csrf-token"]');
+    if (!url || !csrfToken) {
+        return;
+    }
+    fetch(url, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': csrfToken.content,
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ dark_mode: darkMode })
+    });
+}
+
+// Tema değiştirme fonksiyonu
+function toggleTheme() {
+    const html = document.documentElement;
+    const isDark = html.classList.contains('dark-theme');
+    const themeToggle = document.getElementById('theme-toggle');
+
+    if (isDark) {
+        // Açık temaya geç
+        html.classList.remove('dark-theme');
+        localStorage.setItem('theme', 'light');
+        themeToggle.textContent = '🌙';
+        saveThemePreference(false);
+    } else {
+        // Karanlık temaya geç
+        html.classList.add('dark-theme');
+        localStorage.setItem('theme', 'dark');
+        themeToggle.textContent = '🌞';
+        saveThemePreference(true);
+    }
+}
+
+// Sayfa yüklendiğinde doğru ikonu göster
+window.addEventListener('DOMContentLoaded', function() {
+    const themeToggle = document.getElementById('theme-toggle');
+    if (themeToggle) {
+        const isDark = document.documentElement.classList.contains('dark-theme');
+        themeToggle.textContent = isDark ? '🌞' : '🌙';
+    }
+});